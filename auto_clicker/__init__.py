@@ -0,0 +1,8 @@
+"""
+Auto clicker for the Schep Vastgoedmanagers rental listings.
+
+Modules are split so the pure parts (card parsing, listing index, sheet row
+handling, ledger, snapshots) import without Selenium, Faker or gspread; the
+browser is only started when a crawl or submission actually needs it.
+Run the whole workflow with ``python -m auto_clicker`` (see cli.py).
+"""
@@ -0,0 +1,20 @@
+"""
+Atomic file writes: the content goes to path + ".tmp", which then replaces
+path (os.replace), so a crash never leaves a half-written snapshot, cache,
+journal or report behind.
+"""
+import json
+import os
+from contextlib import contextmanager
+
+@contextmanager
+def atomic_open(path, newline=None):
+    """Open a temporary file for writing text; it replaces path when the block ends without error."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline=newline) as f:
+        yield f
+    os.replace(tmp, path)
+
+def atomic_write_json(path, data, **dump_kwargs):
+    with atomic_open(path) as f:
+        json.dump(data, f, **dump_kwargs)
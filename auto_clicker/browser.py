@@ -0,0 +1,460 @@
+"""
+Lazily started Chrome session plus the readiness waits that replace fixed sleeps.
+
+In lean mode (config.lean) Chrome runs headless with an eager page-load
+strategy, and images, media, fonts and known analytics hosts are blocked
+through CDP (Network.setBlockedURLs). The performance log is read to report
+how many requests were blocked and how many bytes were actually transferred.
+
+Selenium is imported inside Browser.start(), so importing this module (or any
+module that only needs the parser, index or sheet logic) never opens Chrome.
+
+MemoryWatchdog samples the Chrome process tree's memory (psutil) and page-load
+times at safe boundaries and restarts the driver when either degrades; see
+Browser.recycle().
+"""
+import json
+import logging
+import os
+import statistics
+import time
+from collections import deque
+
+from . import trace
+from .cards import CARD_SELECTOR
+from .pacing import Pacer
+from .timeouts import TimeoutPolicy
+
+log = logging.getLogger(__name__)
+
+# URL patterns blocked in lean mode (Chrome wildcard syntax; trailing * allows query strings)
+LEAN_BLOCKED_URLS = [
+    # images
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    # media
+    "*.mp4*", "*.webm*", "*.mp3*", "*.m4a*",
+    # fonts
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    # analytics / tracking
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*",
+]
+
+class Browser:
+    """Owns the WebDriver; it is created on first access of .driver or wait_for()."""
+
+    def __init__(self, config):
+        self.config = config
+        self._driver = None
+        self.timeouts = TimeoutPolicy(config)
+        self.pacer = Pacer(config)  # every page load / pagination click goes through pacer.run()
+        self.ready = Readiness(self)
+        self.network = NetworkStats()
+        self.watchdog = MemoryWatchdog(self)
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self.start()
+        return self._driver
+
+    def open(self, url):
+        """driver.get(url); returns True so it can be passed to pacer.run()."""
+        self.driver.get(url)
+        return True
+
+    def wait_for(self, step, condition):
+        """
+        WebDriverWait(...).until(condition) limited to step's budget and any
+        open deadline (see TimeoutPolicy). Raises TimeoutException as before;
+        the timeout is recorded against step.
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver = self.driver
+        budget = self.timeouts.budget(step)
+        start = time.time()
+        try:
+            return WebDriverWait(driver, budget, poll_frequency=0.2).until(condition)
+        except TimeoutException:
+            self.timeouts.hit(step, time.time() - start)
+            raise
+
+    @property
+    def started(self):
+        return self._driver is not None
+
+    def start(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        chrome_options = Options()
+        chrome_options.add_argument("--start-maximized")
+        if self.config.headless or self.config.lean:
+            chrome_options.add_argument("--headless=new")
+        if self.config.lean:
+            chrome_options.page_load_strategy = "eager"
+        if self.config.profile_dir:
+            # keeps cookie consent and the HTTP cache between runs
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.config.profile_dir)}")
+        if self.captures_network:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        with trace.span("startup") as s:
+            self._driver = webdriver.Chrome(options=chrome_options)
+            self._driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": READY_HOOKS_JS})
+            if self.captures_network:
+                self._driver.execute_cdp_cmd("Network.enable", {})
+            if self.config.lean:
+                self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+                s["mode"] = "lean"
+        self.watchdog.started()
+
+    @property
+    def captures_network(self):
+        """True when Chrome's performance (DevTools network) log is recorded."""
+        return self.config.lean or self.config.data_source == "feed"
+
+    def performance_entries(self):
+        """
+        Drain Chrome's performance log (lean / feed mode only) and return the
+        DevTools messages as dicts ({"method", "params"}). Network stats are
+        updated from every drained batch.
+        """
+        if self._driver is None or not self.captures_network:
+            return []
+        try:
+            raw = self._driver.get_log("performance")
+        except Exception:
+            return []
+        messages = []
+        for entry in raw:
+            try:
+                messages.append(json.loads(entry["message"])["message"])
+            except (KeyError, ValueError):
+                continue
+        self.network.update(messages)
+        return messages
+
+    def ensure_alive(self):
+        """Drop a dead driver (crashed Chrome) so the next access starts a new one."""
+        if self._driver is None:
+            return
+        try:
+            self._driver.current_url
+        except Exception:
+            log.warning("Browser session lost — restarting on next use")
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+    def recycle(self):
+        """
+        Replace the driver with a fresh Chrome, carrying the session cookies
+        over (via CDP, so no page has to be open). The new Chrome shows a blank
+        page; the caller brings back whatever it needs.
+        """
+        cookies = []
+        try:
+            cookies = self._driver.get_cookies()
+        except Exception:
+            pass
+        self.performance_entries()
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
+        self.start()
+        if cookies:
+            for cookie in cookies:
+                if "expiry" in cookie:
+                    cookie["expires"] = cookie.pop("expiry")
+            try:
+                self._driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            except Exception as e:
+                log.warning("Could not restore cookies: %s", e)
+
+    def quit(self):
+        if self._driver is not None:
+            self.performance_entries()
+            try:
+                self._driver.quit()
+            finally:
+                self._driver = None
+
+# --- Readiness waits (replace fixed sleeps) ---
+# Counts in-flight XHR/fetch requests and records the time of the last DOM
+# mutation. Browser.start() registers it for every new document (CDP
+# Page.addScriptToEvaluateOnNewDocument), so requests a page starts before the
+# first settle() poll are counted too; READY_PROBE_JS installs it as a fallback.
+READY_HOOKS_JS = """
+(function () {
+    var w = window;
+    if (w.__acbProbe) { return; }
+    var p = w.__acbProbe = {pending: 0, lastMutation: Date.now()};
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        p.pending++;
+        this.addEventListener('loadend', function () { p.pending = Math.max(0, p.pending - 1); });
+        return send.apply(this, arguments);
+    };
+    if (w.fetch) {
+        var f = w.fetch;
+        w.fetch = function () {
+            p.pending++;
+            return f.apply(this, arguments).finally(function () { p.pending = Math.max(0, p.pending - 1); });
+        };
+    }
+    new MutationObserver(function () { p.lastMutation = Date.now(); })
+        .observe(document, {childList: true, subtree: true, characterData: true});
+})();
+"""
+
+# Reports the page's readiness state (installing the hooks if they are missing).
+READY_PROBE_JS = READY_HOOKS_JS + """
+var w = window;
+var probe = w.__acbProbe;
+var nuxtBusy = !!(w.$nuxt && w.$nuxt.$loading && w.$nuxt.$loading.show);
+return {
+    loaded: document.readyState !== 'loading',
+    pending: probe.pending,
+    quiet_ms: Date.now() - probe.lastMutation,
+    rendered: !nuxtBusy
+};
+"""
+
+READY_QUIET_MS = 300  # DOM must be unchanged this long to count as settled
+READY_POLL = 0.1
+
+class Readiness:
+    """
+    Event-driven waits on the browser's current page, with idle-time
+    accounting: how long the waits took vs. the fixed sleeps they replace.
+    """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.reset()
+
+    def reset(self):
+        self.stats = {"waits": 0, "waited": 0.0, "budget": 0.0, "timeouts": 0}
+
+    def settle(self, timeout, quiet_ms=READY_QUIET_MS, record=True):
+        """
+        Wait until the page is loaded, Nuxt is not rendering, no XHR/fetch is in
+        flight and the DOM has been quiet for quiet_ms. Gives up after timeout
+        seconds (the old fixed sleep). Returns True if the page settled.
+        """
+        start = time.time()
+        settled = False
+        while True:
+            try:
+                state = self.browser.driver.execute_script(READY_PROBE_JS)
+                if state["loaded"] and state["rendered"] and state["pending"] == 0 and state["quiet_ms"] >= quiet_ms:
+                    settled = True
+                    break
+            except Exception:
+                # navigation in progress; the probe is re-injected on the next poll
+                pass
+            if time.time() - start >= timeout:
+                break
+            time.sleep(READY_POLL)
+        if record:
+            self.record(time.time() - start, timeout, settled)
+        return settled
+
+    def card_signature(self):
+        """Return the hrefs of the offer cards currently on the page."""
+        try:
+            return self.browser.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".map(function (c) { var a = c.querySelector('a.offer-card__content'); return a ? a.href : ''; });",
+                CARD_SELECTOR,
+            )
+        except Exception:
+            return None
+
+    def wait_for_cards_change(self, previous, timeout=10, budget=2):
+        """
+        Wait until the offer-card set differs from previous (after a page turn)
+        and the page has settled, within timeout seconds overall.
+        budget is the fixed sleep this replaces.
+        """
+        start = time.time()
+        changed = False
+        while time.time() - start < timeout:
+            current = self.card_signature()
+            if current and current != previous:
+                changed = True
+                break
+            time.sleep(READY_POLL)
+        if changed:
+            changed = self.settle(max(READY_POLL, timeout - (time.time() - start)), record=False)
+        self.record(time.time() - start, budget, changed)
+        return changed
+
+    def record(self, waited, budget, ok):
+        self.stats["waits"] += 1
+        self.stats["waited"] += waited
+        self.stats["budget"] += budget
+        if not ok:
+            self.stats["timeouts"] += 1
+
+    def report(self):
+        saved = self.stats["budget"] - self.stats["waited"]
+        log.info(
+            "Idle wait: %.1fs over %s waits (%s hit their timeout); fixed sleeps would have been %.1fs, saved %.1fs",
+            self.stats["waited"], self.stats["waits"], self.stats["timeouts"], self.stats["budget"], saved
+        )
+
+# Navigation timing of the current document: (timeOrigin, DOMContentLoaded in ms)
+NAV_TIMING_JS = """
+var n = performance.getEntriesByType('navigation')[0];
+return n && n.domContentLoadedEventEnd > 0 ? [performance.timeOrigin, n.domContentLoadedEventEnd] : null;
+"""
+
+WATCHDOG_WINDOW = 5  # page loads in the baseline and in the recent window
+
+class MemoryWatchdog:
+    """
+    Watches Chrome's resident memory (the whole process tree under
+    chromedriver) and page-load latency. check() is called at safe boundaries
+    (before a listing, before a home type, before every further results page)
+    and recycles the driver when the RSS exceeds
+    config.recycle_rss_mb or recent loads are recycle_slowdown times slower
+    than right after startup. psutil is optional; without it only latency is
+    watched.
+    """
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.config = browser.config
+        self.loads = deque(maxlen=WATCHDOG_WINDOW)
+        self.baseline = []
+        self.last_origin = None
+        self._psutil = None
+        try:
+            import psutil
+
+            self._psutil = psutil
+        except ImportError:
+            log.warning("psutil not installed — Chrome memory is not watched")
+        self.reset()
+
+    def reset(self):
+        self.samples = 0
+        self.peak_rss = 0
+        self.recycles = []  # (reason, rss_mb)
+
+    def started(self):
+        """A fresh driver: start a new latency baseline."""
+        self.loads.clear()
+        self.baseline = []
+        self.last_origin = None
+
+    def chrome_rss(self):
+        """Resident memory of Chrome's process tree in MB, or None if unknown."""
+        if self._psutil is None or not self.browser.started:
+            return None
+        try:
+            root = self._psutil.Process(self.browser.driver.service.process.pid)
+            total = 0
+            for proc in root.children(recursive=True):
+                try:
+                    total += proc.memory_info().rss
+                except self._psutil.Error:
+                    continue
+            return total / (1024 * 1024)
+        except (self._psutil.Error, AttributeError):
+            return None
+
+    def sample_load(self):
+        try:
+            timing = self.browser.driver.execute_script(NAV_TIMING_JS)
+        except Exception:
+            return
+        if not timing or timing[0] == self.last_origin:
+            return  # no new navigation since the last sample
+        self.last_origin = timing[0]
+        seconds = timing[1] / 1000
+        if len(self.baseline) < WATCHDOG_WINDOW:
+            self.baseline.append(seconds)
+        self.loads.append(seconds)
+
+    def reason(self, rss):
+        if self.config.recycle_rss_mb and rss is not None and rss > self.config.recycle_rss_mb:
+            return f"memory {rss:.0f} MB > {self.config.recycle_rss_mb:.0f} MB"
+        if (self.config.recycle_slowdown and len(self.baseline) == WATCHDOG_WINDOW
+                and len(self.loads) == WATCHDOG_WINDOW):
+            base, recent = statistics.median(self.baseline), statistics.median(self.loads)
+            if base > 0 and recent > base * self.config.recycle_slowdown:
+                return f"page loads {recent:.2f}s vs {base:.2f}s after startup"
+        return None
+
+    def check(self):
+        """
+        Sample memory and load time; recycle the driver if a threshold is
+        exceeded. Call only at a safe boundary. Returns True if recycled.
+        """
+        if not self.browser.started:
+            return False
+        self.sample_load()
+        rss = self.chrome_rss()
+        self.samples += 1
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+        reason = self.reason(rss)
+        if reason is None:
+            return False
+        log.warning("♻ Recycling Chrome: %s", reason)
+        with trace.span("recycle", reason=reason, rss_mb=round(rss or 0)):
+            self.browser.recycle()
+        self.recycles.append((reason, rss))
+        return True
+
+    def report(self):
+        if not self.samples:
+            return
+        peak = f"peak {self.peak_rss:.0f} MB" if self._psutil else "memory not measured"
+        log.info("Chrome watchdog: %s over %s checks, %s recycles", peak, self.samples, len(self.recycles))
+        for reason, _ in self.recycles:
+            log.info("  ♻ %s", reason)
+
+class NetworkStats:
+    """Request / byte counters built from DevTools Network.* events."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.bytes = 0
+        self.blocked = {}  # resource type -> count
+        self._types = {}   # requestId -> resource type
+
+    def update(self, messages):
+        for m in messages:
+            method, params = m.get("method"), m.get("params", {})
+            if method == "Network.requestWillBeSent":
+                self.requests += 1
+                self._types[params.get("requestId")] = params.get("type", "Other")
+            elif method == "Network.loadingFinished":
+                self.bytes += int(params.get("encodedDataLength") or 0)
+                self._types.pop(params.get("requestId"), None)
+            elif method == "Network.loadingFailed":
+                kind = self._types.pop(params.get("requestId"), params.get("type", "Other"))
+                if params.get("blockedReason"):
+                    self.blocked[kind] = self.blocked.get(kind, 0) + 1
+
+    def report(self):
+        if not self.requests:
+            return
+        blocked = sum(self.blocked.values())
+        by_type = ", ".join(f"{k} {v}" for k, v in sorted(self.blocked.items())) or "none"
+        log.info(
+            "Network: %s requests, %s blocked (%s); %.0f KB transferred",
+            self.requests, blocked, by_type, self.bytes / 1024
+        )
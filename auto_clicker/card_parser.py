@@ -0,0 +1,85 @@
+"""
+Offer-card text parser: price, living area and bedrooms from the text of one
+results card. Pure Python with precompiled patterns, so it can be tested and
+profiled without a browser (see bench/parse_benchmark.py and the fixtures in
+bench/fixtures/cards.jsonl).
+
+A card's text looks like
+
+    Kerkstraat 12
+    1234 AB Amsterdam
+    € 1.250 p/m
+    75 m² 3
+"""
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# "1.250", "1,250" (thousands), "1250"; then optional cents ",00", ".00" or ",-"
+AMOUNT = r"(\d{1,3}(?:\.\d{3})+(?!\d)|\d{1,3}(?:,\d{3})+(?!\d)|\d+)(?:[.,](\d{1,2}|-)(?!\d))?"
+# "€ 1.250 p/m", "€1.250,00 per maand", "€ 950 /mnd", "€ 1,250 p/m"
+PRICE_RE = re.compile(r"€\s*" + AMOUNT + r"\s*(?:p/m|per maand|/\s*mnd|p\.m\.)", re.IGNORECASE)
+# the <b> price element on its own: "€ 1.250 p/m", "€ 1.250,00"
+PRICE_TEXT_RE = re.compile(AMOUNT)
+# "75 m²", "75m2", "75,5 m²", plus the details item right after it: "75 m² 3"
+AREA_RE = re.compile(r"(\d+)(?:[.,]\d+)?\s*m(?:²|2)(?!\w)(?:[ \t]*\n?[ \t]*(\d{1,2})(?![\d.,]|\s*m(?:²|2)))?")
+# "3 slaapkamers", "3 slpk", "3 bedrooms"
+BEDROOMS_LABEL_RE = re.compile(r"(\d+)\s*(?:slaapkamers?|slpk\.?|bedrooms?)\b", re.IGNORECASE)
+
+@dataclass(slots=True)
+class CardRecord:
+    price: Optional[int]
+    price_source: Optional[str]  # "XPATH" (the <b> element) or "fallback" (card text)
+    living_area: Optional[int]
+    bedrooms: int
+    href: Optional[str]
+    text: str
+    home_type: Optional[str] = None  # only known from the feed or cards.tag_home_types()
+
+    def as_dict(self):
+        return {
+            "price": self.price,
+            "price_source": self.price_source,
+            "living_area": self.living_area,
+            "bedrooms": self.bedrooms,
+            "href": self.href,
+            "text": self.text,
+            "home_type": self.home_type,
+        }
+
+def euros(whole):
+    """'1.250' or '1,250' -> 1250 (thousands separators; cents are matched separately and dropped)."""
+    return int(whole.replace(".", "").replace(",", ""))
+
+def parse_price(text, price_text=None):
+    """Return (price, source) from the <b> price element, else the card text."""
+    if price_text and "€" in price_text:
+        match = PRICE_TEXT_RE.search(price_text)
+        if match:
+            return euros(match.group(1)), "XPATH"
+    match = PRICE_RE.search(text)
+    if match:
+        return euros(match.group(1)), "fallback"
+    return None, None
+
+def parse_area_bedrooms(text, default_bedrooms=1):
+    """
+    Return (living_area, bedrooms). The area is None when the card has none
+    (the card is then skipped). Bedrooms come from the number shown right
+    after the area, else an explicit label ("3 slaapkamers"), else the
+    default; other numbers on the card (house number, postcode, price) are
+    never taken for bedrooms.
+    """
+    match = AREA_RE.search(text)
+    if match and match.group(2):
+        return int(match.group(1)), int(match.group(2))
+    area = int(match.group(1)) if match else None
+    label = BEDROOMS_LABEL_RE.search(text)
+    return area, int(label.group(1)) if label else default_bedrooms
+
+def parse(text, price_text=None, href=None):
+    """Parse one card into a CardRecord; missing values are None (bedrooms defaults to 1)."""
+    text = text or ""
+    price, price_source = parse_price(text, price_text)
+    living_area, bedrooms = parse_area_bedrooms(text)
+    return CardRecord(price, price_source, living_area, bedrooms, href, text)
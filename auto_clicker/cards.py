@@ -0,0 +1,87 @@
+"""
+Offer-card extraction and parsing.
+
+extract_cards() reads every card on a results page with one execute_script
+call; parse_card() turns the raw fields into price / area / bedrooms with
+card_parser. Nothing here imports Selenium.
+"""
+import json
+import logging
+import re
+
+from . import card_parser
+
+log = logging.getLogger(__name__)
+
+CARD_SELECTOR = "div.property.offer-card"
+
+# Collects the raw fields of every offer card on the page in one round trip.
+# Parsing happens in Python (parse_card) so the rules stay in one place.
+EXTRACT_CARDS_JS = """
+var cards = document.querySelectorAll(arguments[0]);
+var out = [];
+for (var i = 0; i < cards.length; i++) {
+    var c = cards[i];
+    var priceText = null;
+    var bolds = c.querySelectorAll('b');
+    for (var j = 0; j < bolds.length; j++) {
+        var t = bolds[j].textContent || '';
+        if (t.indexOf('€') !== -1) { priceText = t; break; }
+    }
+    var link = c.querySelector('a.offer-card__content');
+    out.push({
+        text: c.innerText || c.textContent || '',
+        price_text: priceText,
+        href: link ? link.href : null
+    });
+}
+return JSON.stringify(out);
+"""
+
+def parse_card(raw):
+    """
+    Turn the raw fields collected by EXTRACT_CARDS_JS into a card dict:
+    price, price_source, living_area, bedrooms, href and text (see
+    card_parser.parse). Missing values are None (bedrooms defaults to 1).
+    """
+    return card_parser.parse(raw.get("text"), raw.get("price_text"), raw.get("href")).as_dict()
+
+def card_problem(card):
+    """Why a parsed card cannot be indexed ("no price", ...), or None if it can."""
+    if card["price"] is None:
+        return "no price"
+    if card["living_area"] is None:
+        return "no living area"
+    if not card["href"]:
+        return "no listing URL"
+    return None
+
+def tag_home_types(cards, home_types):
+    """
+    Set card["home_type"] for cards of the unfiltered list that do not have
+    one yet (DOM cards; feed cards carry it): the single home type of
+    home_types named in the card text, as a whole word. Cards naming none or
+    several keep None. Returns the number of cards left without a home type.
+    """
+    patterns = [(h, re.compile(r"\b" + re.escape(h) + r"\b", re.IGNORECASE)) for h in home_types]
+    unknown = 0
+    for card in cards:
+        if not card.get("home_type"):
+            named = [h for h, pattern in patterns if pattern.search(card.get("text") or "")]
+            card["home_type"] = named[0] if len(named) == 1 else None
+        if not card["home_type"]:
+            unknown += 1
+    return unknown
+
+def extract_cards(driver):
+    """
+    Read every offer card on the current results page with a single
+    execute_script call. Returns a list of parsed card dicts (see parse_card).
+    """
+    try:
+        payload = driver.execute_script(EXTRACT_CARDS_JS, CARD_SELECTOR)
+        raw_cards = json.loads(payload or "[]")
+    except Exception as e:
+        log.error("Card extraction failed: %s", e)
+        return []
+    return [parse_card(raw) for raw in raw_cards]
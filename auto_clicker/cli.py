@@ -0,0 +1,360 @@
+"""
+Command-line entry point: runs the whole workflow for one sheet.
+
+    python -m auto_clicker --headless --incremental
+    python -m auto_clicker --headless --resume   # after a crash
+    python -m auto_clicker --headless --dry-run --report matches.csv
+
+run() can also be called from a long-lived scheduler process; pass the same
+Browser to consecutive runs to reuse one Chrome session.
+"""
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from . import trace
+from .cards import tag_home_types
+from .config import Config
+from .journal import RunJournal
+from .ledger import SubmissionLedger
+from .listing_index import ListingIndex
+from .logs import LEVELS, setup_logging, stop_logging
+from .report import row_report, write_report
+from .sheet import SheetSource, normalize_rows, row_home_type, row_limits
+from .snapshot import load_snapshot, save_snapshot, merge_snapshot, snapshot_cards
+
+log = logging.getLogger(__name__)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="auto_clicker", description="Apply to matching rental listings for every sheet row.")
+    parser.add_argument("--base-url", help="results page to start from")
+    parser.add_argument("--sheet-file", help="JSON rows to use instead of the Google Sheet")
+    parser.add_argument("--headless", action="store_true", default=None, help="run Chrome headless")
+    parser.add_argument("--profile-dir", help="persistent Chrome profile directory (one process at a time)")
+    parser.add_argument("--every", type=float, metavar="MINUTES",
+                        help="stay running and repeat the workflow every MINUTES in one warm browser")
+    parser.add_argument("--lean", action="store_true", default=None,
+                        help="headless, eager page loads, block images/media/fonts/analytics")
+    parser.add_argument("--data-source", choices=["dom", "feed"],
+                        help="read listings from rendered cards (dom) or the site's JSON feed (feed)")
+    parser.add_argument("--direct-urls", action="store_true", default=None,
+                        help="load filtered and paged result URLs directly (verified once against the UI)")
+    parser.add_argument("--unfiltered", dest="crawl_unfiltered", action="store_true", default=None,
+                        help="crawl the unfiltered list once for all rows; listings are matched to a row's"
+                             " home type by the feed's type field or the home type named on the card")
+    parser.add_argument("--incremental", action="store_true", default=None,
+                        help="stop paging at the first page of already-seen listings")
+    parser.add_argument("--ledger", dest="ledger_path", help="SQLite submission ledger")
+    parser.add_argument("--snapshot", dest="snapshot_path", help="listing snapshot for --incremental")
+    parser.add_argument("--trace", dest="trace_path", help="JSONL file for per-stage timing spans")
+    parser.add_argument("--strategy-cache", dest="strategy_cache_path", help="JSON cache of winning selector strategies")
+    parser.add_argument("--listing-cache", dest="listing_cache_path", help="JSON cache of listing-page metadata")
+    parser.add_argument("--listing-cache-ttl", type=float, metavar="MINUTES",
+                        help="re-check a cached listing (closed, no form, form fields) after MINUTES")
+    parser.add_argument("--listing-cache-size", type=int, help="listings kept in the listing cache")
+    parser.add_argument("--journal", dest="journal_path", help="JSON journal of the current run's progress")
+    parser.add_argument("--resume", action="store_true", default=None,
+                        help="continue where an interrupted run stopped (same sheet rows and settings)")
+    parser.add_argument("--recycle-mb", dest="recycle_rss_mb", type=float,
+                        help="restart Chrome when its processes use more than this many MB (0 = never)")
+    parser.add_argument("--recycle-slowdown", type=float,
+                        help="restart Chrome when page loads are this many times slower than at startup (0 = never)")
+    parser.add_argument("--timeout-scale", type=float,
+                        help="multiply every per-step wait budget (e.g. 2 for a slow connection)")
+    parser.add_argument("--listing-deadline", type=float, help="seconds one listing submission may take in total")
+    parser.add_argument("--home-type-deadline", type=float, help="seconds filtering and crawling one home type may take")
+    parser.add_argument("--max-rate", dest="max_requests_per_minute", type=float,
+                        help="at most this many page loads / pagination clicks per minute (0 = no ceiling)")
+    parser.add_argument("--retries", dest="page_retries", type=int, help="retries of a failed page load or page turn")
+    parser.add_argument("--dry-run", action="store_true", default=None,
+                        help="crawl and match only: write the report, open no listing, submit nothing")
+    parser.add_argument("--report", dest="report_path", help="dry-run report file (.json or .csv)")
+    parser.add_argument("--log-level", choices=LEVELS, help="log verbosity; debug prints every parsed card")
+    parser.add_argument("--log-json", action="store_true", default=None, help="write logs as JSON lines")
+    return parser
+
+def main(argv=None):
+    options = vars(build_parser().parse_args(argv))
+    every = options.pop("every")
+    config = Config.from_env(**options)
+    setup_logging(config.log_level, config.log_json)
+    try:
+        if every:
+            serve(config, every * 60)
+        else:
+            run(config)
+    finally:
+        stop_logging()
+
+def serve(config, interval):
+    """
+    Long-lived mode: run the workflow every interval seconds, reusing one
+    browser session (restarted only if Chrome dies). A run that fails is
+    logged and the next one starts at the following interval. Stops on Ctrl+C.
+    """
+    from .browser import Browser
+
+    browser = Browser(config)
+    try:
+        while True:
+            started = time.time()
+            try:
+                browser.ensure_alive()
+                run(config, browser)
+            except Exception:
+                log.exception("Run failed — trying again at the next interval")
+            delay = max(0.0, interval - (time.time() - started))
+            log.info("Next run in %.0fs", delay)
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        log.info("Stopping")
+    finally:
+        browser.quit()
+        log.info("Browser closed")
+
+def run(config, browser=None):
+    """
+    Run Steps 1-4 for config. When browser is given it is reused and left
+    open; otherwise a Browser is created (lazily) and quit at the end.
+    """
+    from .browser import Browser
+    from .crawler import Crawler
+    from .submitter import Submitter
+
+    trace.configure(config.trace_path)
+    own_browser = browser is None
+    if own_browser:
+        browser = Browser(config)
+    browser.ready.reset()
+    browser.network.reset()
+    browser.watchdog.reset()
+    browser.timeouts.reset()
+    browser.pacer.reset()
+    crawler = Crawler(browser, config)
+    submitter = Submitter(browser, config)
+    ledger = SubmissionLedger(config.ledger_path)
+    source = SheetSource(config)
+    journal = RunJournal(config.journal_path)
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheet")
+    startup = None  # (browser seconds, sheet seconds, wall seconds)
+    try:
+        # --- Steps 1 + 2 overlap: the sheet loads on a worker thread while Chrome starts ---
+        started = time.time()
+        sheet_future = pool.submit(load_sheet, source)
+
+        # --- Step 1: Navigate & Accept Cookies (first time) ---
+        try:
+            crawler.open_base_page()
+        except Exception as e:
+            log.error("Setup error: %s", e)
+            return
+        browser_time = time.time() - started
+
+        # --- Step 2: Read Sheet & Normalize Data (collect the worker's result) ---
+        try:
+            sheet_rows, sheet_time = sheet_future.result()
+        except ValueError as e:
+            log.error("%s", e)
+            return
+        except Exception as e:
+            log.error("Sheet load failed: %s", e)
+            return
+        startup = (browser_time, sheet_time, time.time() - started)
+        log.info("Loaded %s home types from sheet", len(sheet_rows))
+        if journal.start(sheet_rows, config, resume=config.resume):
+            log.info("Resuming interrupted run (stopped at row %s)", journal.data["row"] or 1)
+        results = journal.results  # sheet row number -> {"matched", "submitted", "failed"}
+
+        # --- Step 3: Crawl each distinct home type once and index the results ---
+        indexes, rows = crawl(crawler, config, sheet_rows, journal)
+
+        if config.dry_run:
+            # --- Dry run: report matches and rejections per row instead of Step 4 ---
+            entries = []
+            for idx, row, home_type in rows:
+                key = None if config.crawl_unfiltered else home_type
+                email = str(row.get("Email", ""))
+                entries.append(row_report(idx + 1, home_type, row_limits(row), indexes.get(key) or ListingIndex(),
+                                          crawler.rejected.get(key, ()), partial(ledger.is_done, email=email),
+                                          match_home_type=config.crawl_unfiltered))
+            write_report(config.report_path, entries)
+            journal.finish()
+            return
+
+        # --- Step 4: Match each row against the index and process its listings ---
+        for idx, row, home_type in rows:
+            index = indexes.get(None if config.crawl_unfiltered else home_type)
+            if index is None:
+                log.warning("Row %s: no results crawled for '%s', skipping", idx, home_type)
+                continue
+            journal.row_started(idx)
+
+            max_price, max_area, max_rooms = row_limits(row)
+            email = str(row.get("Email", ""))
+            type_filter = home_type if config.crawl_unfiltered else None
+            matched = [card["href"] for card in index.query(max_price, max_area, max_rooms, type_filter)]
+            valid_listings = [url for url in matched if not ledger.is_done(url, email)]
+            log.info("[%s/%s] Found %s filtered listings for '%s' (%s already submitted).",
+                     idx, len(sheet_rows), len(matched), home_type, len(matched) - len(valid_listings))
+
+            # get_all_records() starts at sheet row 2 (row 1 is the header)
+            result = results.setdefault(idx + 1, {"matched": 0, "submitted": 0, "failed": 0})
+            result["matched"] = len(matched)
+            for listing_url in valid_listings:
+                state = journal.listing_state(idx, listing_url)
+                if state not in (None, "pending"):
+                    log.info("Resumed run already handled %s (%s), skipping.", listing_url, state)
+                    continue
+                # an earlier row in this run may have submitted the same pair
+                if ledger.is_done(listing_url, email):
+                    log.info("Already submitted %s for %s, skipping.", listing_url, email)
+                    continue
+                browser.watchdog.check()
+                journal.listing_started(idx, listing_url)
+                with browser.timeouts.deadline("listing", config.listing_deadline):
+                    outcome = submitter.submit_listing(listing_url, row)
+                ledger.record(listing_url, email, outcome)
+                browser.performance_entries()
+                if outcome in SubmissionLedger.DONE_OUTCOMES:
+                    result["submitted"] += 1
+                else:
+                    result["failed"] += 1
+                journal.listing_done(idx, listing_url, outcome)
+
+        with trace.span("sheet_write_back") as s:
+            source.write_results(results)
+            s["rows"] = len(results)
+        journal.finish()
+    finally:
+        # All done
+        pool.shutdown(wait=False, cancel_futures=True)
+        crawler.strategies.save()
+        submitter.listing_cache.save()
+        browser.performance_entries()
+        browser.network.report()
+        browser.ready.report()
+        browser.watchdog.report()
+        browser.timeouts.report()
+        browser.pacer.report()
+        submitter.listing_cache.report()
+        if startup:
+            browser_time, sheet_time, wall = startup
+            log.info("Startup: browser %.1fs and sheet %.1fs overlapped in %.1fs, saved %.1fs",
+                     browser_time, sheet_time, wall, browser_time + sheet_time - wall)
+        trace.report()
+        ledger.close()
+        if own_browser:
+            browser.quit()
+            log.info("Automation finished and browser closed")
+
+def load_sheet(source):
+    """
+    Load and normalize the sheet rows; runs on a worker thread while the
+    browser starts. Returns (rows, seconds). Raises ValueError for bad rows.
+    """
+    started = time.time()
+    with trace.span("sheet_load") as s:
+        sheet_data_raw = source.load()
+        s["rows"] = len(sheet_data_raw)
+    return normalize_rows(sheet_data_raw), time.time() - started
+
+def crawl(crawler, config, sheet_rows, journal):
+    """
+    Crawl each distinct home type once (or, with config.crawl_unfiltered, the
+    whole unfiltered list a single time) and return (indexes, rows):
+    {home_type: ListingIndex} and the (idx, row, home_type) tuples to process.
+    Home types and pages already in the run journal are not crawled again.
+    """
+    rows = []
+    for idx, row in enumerate(sheet_rows, start=1):
+        home_type = row_home_type(row)
+        if not home_type:
+            log.warning("Row %s: no home_type value, skipping", idx)
+            continue
+        rows.append((idx, row, home_type))
+
+    row_home_types = list(dict.fromkeys(home_type for _, _, home_type in rows))
+    crawl_keys = [None] if config.crawl_unfiltered else row_home_types
+
+    snapshots = load_snapshot(config.snapshot_path) if config.incremental else {}
+
+    indexes = {}
+    for n, home_type in enumerate(crawl_keys, start=1):
+        label = home_type if home_type is not None else "(all home types)"
+        key = home_type if home_type is not None else "*"
+        saved = journal.crawled_cards(key)
+        if saved is not None:
+            indexes[home_type] = ListingIndex(saved)
+            log.info("[%s/%s] '%s': %s listings taken from the run journal", n, len(crawl_keys), label, len(saved))
+            continue
+        log.info("[%s/%s] Applying filter for home type: '%s'", n, len(crawl_keys), label)
+        crawler.browser.watchdog.check()
+        with crawler.browser.timeouts.deadline("home_type", config.home_type_deadline):
+            if not crawler.select_home_type(home_type):
+                continue
+
+            # resume a home type that was interrupted midway through its pages
+            done_page, done_cards = journal.crawl_progress(key)
+            first_page = 1
+            if done_page:
+                if config.data_source == "dom" and crawler.skip_to_page(done_page + 1):
+                    first_page = done_page + 1
+                    log.info("Resuming '%s' at page %s (%s listings from the run journal)",
+                             label, first_page, len(done_cards))
+                else:
+                    # skip_to_page() may have stopped on some later page: put page 1
+                    # back on screen before crawling from the start
+                    done_cards = []
+                    journal.restart_crawl(key)
+                    if config.data_source == "dom" and not crawler.select_home_type(home_type):
+                        log.warning("Could not resume '%s' at page %s, nor reload page 1 — skipping it",
+                                    label, done_page + 1)
+                        continue
+                    log.warning("Could not resume '%s' at page %s — crawling it again", label, done_page + 1)
+            on_page = partial(journal.page_done, key)
+            if home_type is None:
+                # the journal keeps no card text, so tag each page before it is saved
+                on_page = partial(tag_page, row_home_types, on_page)
+
+            if not config.incremental:
+                cards, _ = crawler.crawl_results(first_page=first_page, on_page=on_page)
+                index_cards = done_cards + cards
+                if home_type is None:
+                    tag_unfiltered(index_cards, row_home_types)
+            else:
+                previous = snapshots.get(key, {})
+                cards, complete = crawler.crawl_results(known=set(previous) if previous else None,
+                                                        first_page=first_page, on_page=on_page)
+                if home_type is None:
+                    tag_unfiltered(done_cards + cards, row_home_types)
+                snapshot, new, removed, changed = merge_snapshot(previous, done_cards + cards, complete)
+                snapshots[key] = snapshot
+                save_snapshot(config.snapshot_path, snapshots)
+                log.info("Incremental '%s': %s new, %s removed, %s changed (%s)", label, len(new), len(removed),
+                         len(changed), "full sweep" if complete else "stopped early")
+                for url in new:
+                    log.info("  + %s", url)
+                for url in removed:
+                    log.info("  - %s", url)
+                for url, old, fields in changed:
+                    log.info("  ~ %s: %s -> %s", url, old, fields)
+                index_cards = snapshot_cards(snapshot)
+        indexes[home_type] = ListingIndex(index_cards)
+        journal.crawl_done(key, index_cards)
+        log.info("Indexed %s listings for '%s'", len(indexes[home_type]), label)
+        crawler.browser.performance_entries()
+    return indexes, rows
+
+def tag_page(home_types, save, page, cards):
+    """on_page callback for the unfiltered crawl: tag the page's cards, then save(page, cards)."""
+    tag_home_types(cards, home_types)
+    save(page, cards)
+
+def tag_unfiltered(cards, home_types):
+    """Give the cards of the unfiltered list their home type, so each row only matches its own."""
+    unknown = tag_home_types(cards, home_types)
+    if unknown:
+        log.warning("%s of %s listings show none of the sheet's home types;"
+                    " with --unfiltered they are not matched to any row", unknown, len(cards))
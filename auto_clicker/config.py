@@ -0,0 +1,73 @@
+import os
+from dataclasses import dataclass, fields
+from typing import Optional
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("0", "false", "no", "off", "")
+
+DEFAULT_BASE_URL = "https://zoeken.schepvastgoedmanagers.nl/huur/woningen?filter=stage:available"  # Base URL with available filter
+
+@dataclass
+class Config:
+    """Settings for one run. Defaults match the original script."""
+
+    base_url: str = DEFAULT_BASE_URL
+    sheet_file: Optional[str] = None  # JSON rows to use instead of the Google Sheet
+    service_account: str = "service_account.json"
+    sheet_name: str = "auto_click_data"
+    worksheet: str = "Sheet1"
+    sheet_cache_path: str = "sheet_cache.json"  # local copy of the sheet, refreshed when it changes
+    headless: bool = False  # headless Chrome (CI / production)
+    profile_dir: Optional[str] = None  # persistent Chrome user-data dir (consent + HTTP cache survive runs)
+    lean: bool = False  # headless + eager page loads, block images/media/fonts/analytics
+    data_source: str = "dom"  # "feed": read listings from the site's JSON feed, DOM as fallback
+    direct_urls: bool = False  # load filtered/paged result URLs directly once verified against the UI
+    crawl_unfiltered: bool = False  # crawl the unfiltered list once for all rows instead of once per home type
+    incremental: bool = False  # stop paging at the first page of already-seen listings
+    ledger_path: str = "submissions.db"  # local SQLite ledger of processed (listing, email) pairs
+    snapshot_path: str = "listing_snapshot.json"  # listing URLs seen per home type (incremental mode)
+    trace_path: str = "run_trace.jsonl"  # per-stage timing spans
+    strategy_cache_path: str = "strategy_cache.json"  # which selector strategies worked, with hit/miss stats
+    listing_cache_path: str = "listing_cache.json"  # listing-page metadata: open/closed, form field IDs
+    listing_cache_ttl: float = 360.0  # minutes before a listing's cached metadata is checked again
+    listing_cache_size: int = 1000  # listings kept in the cache, least recently used evicted first
+    journal_path: str = "run_journal.json"  # progress of the current run, removed when it finishes
+    resume: bool = False  # continue from the journal of an interrupted run
+    recycle_rss_mb: float = 1500.0  # restart Chrome above this process-tree RSS (0 = never)
+    recycle_slowdown: float = 3.0  # restart Chrome when page loads get this much slower (0 = never)
+    timeout_scale: float = 1.0  # multiplies every per-step wait budget (timeouts.STEP_BUDGETS)
+    listing_deadline: float = 90.0  # seconds for one listing, from opening it to the thank-you page
+    home_type_deadline: float = 600.0  # seconds for filtering and crawling one home type
+    max_requests_per_minute: float = 60.0  # ceiling for page loads + pagination clicks (0 = none)
+    page_retries: int = 2  # retries of a failed page load / page turn, with jittered backoff
+    dry_run: bool = False  # crawl and match only, write report_path instead of submitting
+    report_path: str = "dry_run_report.json"  # dry-run matches and rejections (.json or .csv)
+    log_level: str = "info"  # "debug" adds the per-card dumps
+    log_json: bool = False  # one JSON object per log line
+
+    @classmethod
+    def from_env(cls, environ=None, **overrides):
+        """
+        Build a Config from AUTO_CLICK_<FIELD> environment variables
+        (e.g. AUTO_CLICK_BASE_URL, AUTO_CLICK_HEADLESS=1), then apply overrides.
+        Booleans accept 1/true/yes/on and 0/false/no/off (any case); anything
+        else raises ValueError rather than silently meaning False.
+        """
+        environ = os.environ if environ is None else environ
+        values = {}
+        for f in fields(cls):
+            raw = environ.get("AUTO_CLICK_" + f.name.upper())
+            if raw is None:
+                continue
+            if f.type is bool:
+                flag = raw.strip().lower()
+                if flag not in TRUE_VALUES + FALSE_VALUES:
+                    raise ValueError(f"AUTO_CLICK_{f.name.upper()}={raw!r} is not a boolean"
+                                     " (use 1/0, true/false, yes/no, on/off)")
+                values[f.name] = flag in TRUE_VALUES
+            elif f.type in (int, float):
+                values[f.name] = f.type(raw)
+            else:
+                values[f.name] = raw
+        values.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**values)
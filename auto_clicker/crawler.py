@@ -0,0 +1,668 @@
+"""
+Listing crawler: home-type filter selection and result pagination.
+"""
+import json
+import logging
+from functools import partial
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, StaleElementReferenceException
+
+from . import feed, trace
+from .pacing import EMPTY
+from .cards import CARD_SELECTOR, card_problem, extract_cards
+from .strategy_cache import StrategyCache
+from .url_builder import FilterUrlBuilder
+
+log = logging.getLogger(__name__)
+
+CONSENT_COOKIE = "CookieScriptConsent"  # set by the cookie banner once accepted
+NEXT_XPATH = "//button[.//span[text()='Volgende']]"
+
+APPLY_XPATHS = [
+    "//button[contains(normalize-space(.), 'Apply filter')]",
+    "//button[contains(normalize-space(.), 'Filter toepassen')]",
+    "//*[@id='__nuxt']//form//div[contains(@class,'form')]/../div[3]/button[1]",  # try a structure-based path (fallback)
+    "//*[@id='__nuxt']/div/div/div/div/section[2]/article/div/div/div/div[1]/form/div[3]/button[1]"
+]
+
+# Fetches a feed URL from inside the page, so the site's own cookies/origin apply.
+FETCH_JSON_JS = """
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'include', headers: {'Accept': 'application/json'}})
+    .then(function (r) { return r.ok ? r.text() : null; })
+    .then(done, function () { done(null); });
+"""
+
+NUXT_PAYLOAD_JS = "try { return JSON.stringify(window.__NUXT__ || null); } catch (e) { return null; }"
+
+APPLY_JS = """
+var texts = ['Apply filter','Filter toepassen','Apply','Toepassen'];
+var btns = Array.from(document.querySelectorAll('button'));
+for (var b of btns) {
+    var t = b.innerText || b.textContent || '';
+    for (var txt of texts) {
+        if (t.trim().toLowerCase().indexOf(txt.toLowerCase()) !== -1) {
+            b.scrollIntoView({block:'center'});
+            b.click();
+            return true;
+        }
+    }
+}
+// fallback: click first visible button in the filter area
+var form = document.querySelector('section article form');
+if (form) {
+    var fb = form.querySelector('button');
+    if (fb) { fb.scrollIntoView({block:'center'}); fb.click(); return true; }
+}
+return false;
+"""
+
+class Crawler:
+    """Drives the results page of config.base_url through a Browser."""
+
+    def __init__(self, browser, config):
+        self.browser = browser
+        self.config = config
+        self.ready = browser.ready
+        self.strategies = StrategyCache(config.strategy_cache_path)
+        self.urls = FilterUrlBuilder(config.base_url)
+        self.home_type = None  # filter currently applied (set by select_home_type)
+        self.rejected = {}  # home type -> [(card, reason)] for cards that could not be parsed
+
+    @property
+    def driver(self):
+        return self.browser.driver
+
+    def open_base_page(self):
+        """Navigate to the base page and accept cookies (first time)."""
+        self.browser.pacer.run("base_page", partial(self.browser.open, self.config.base_url))
+        log.info("Navigated to base page: %s", self.config.base_url)
+        self.ready.settle(2)
+        self.accept_cookies_once()
+
+    def accept_cookies_once(self):
+        with trace.span("cookie_accept") as s:
+            # consent already given (this session or a persistent profile): no banner to wait for
+            try:
+                if self.driver.get_cookie(CONSENT_COOKIE):
+                    s["outcome"] = "consent_cookie"
+                    return
+            except Exception:
+                pass
+            try:
+                accept_button = self.browser.wait_for("cookie_banner", EC.element_to_be_clickable((By.ID, "cookiescript_accept")))
+                accept_button.click()
+                log.info("Cookies accepted")
+                self.ready.settle(1)
+                s["outcome"] = "accepted"
+            except TimeoutException:
+                # no cookie popup found
+                s["outcome"] = "absent"
+
+    def click_apply_button(self):
+        """
+        Try multiple ways to find/apply the filter button:
+          1) Button by English label 'Apply filter'
+          2) Button by Dutch label 'Filter toepassen'
+          3) Full XPath (page-structure-specific)
+          4) CSS fallback for first submit button inside the filter form
+          5) JS fallback to click first matching button
+        The strategy that worked last time is tried first (see StrategyCache)
+        with the full "apply_button" wait budget; fallbacks get the short one.
+        Returns the name of the strategy that clicked ("xpath1".."xpath4", "css",
+        "js"), or None if nothing was clicked.
+        """
+        strategies = {
+            f"xpath{n}": partial(self._click_apply_xpath, f"xpath{n}", xp)
+            for n, xp in enumerate(APPLY_XPATHS, start=1)
+        }
+        strategies["css"] = self._click_apply_css
+        strategies["js"] = self._click_apply_js
+        clicked = self.strategies.run("apply_button", self._budgeted("apply_button", strategies, "apply_button"))
+        if not clicked:
+            log.warning("Apply button not found")
+        return clicked
+
+    def _budgeted(self, group, strategies, step):
+        """Bind the wait step: step for the strategy tried first, "fallback" for the rest."""
+        first = self.strategies.order(group, list(strategies))[0]
+        return {name: partial(fn, step=step if name == first else "fallback") for name, fn in strategies.items()}
+
+    def _click_apply_xpath(self, name, xp, step):
+        try:
+            btn = self.browser.wait_for(step, EC.element_to_be_clickable((By.XPATH, xp)))
+        except TimeoutException:
+            return None
+        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
+        try:
+            btn.click()
+        except ElementClickInterceptedException:
+            self.driver.execute_script("arguments[0].click();", btn)
+        log.info("Clicked Apply button via XPath: %s", xp)
+        return name
+
+    def _click_apply_css(self, step):
+        # CSS fallback: find first button inside the filter form area
+        try:
+            form_btn = self.browser.wait_for(step, EC.element_to_be_clickable((
+                By.CSS_SELECTOR,
+                "section article form button, form button.btn"
+            )))
+        except TimeoutException:
+            return None
+        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", form_btn)
+        try:
+            form_btn.click()
+        except ElementClickInterceptedException:
+            self.driver.execute_script("arguments[0].click();", form_btn)
+        log.info("Clicked Apply button via CSS fallback")
+        return "css"
+
+    def _click_apply_js(self, step):
+        # Last resort: JS to find button by innerText containing common words (no wait, step unused)
+        try:
+            clicked = self.driver.execute_script(APPLY_JS)
+        except Exception as e:
+            log.warning("JS fallback failed: %s", e)
+            return None
+        if clicked:
+            log.info("Clicked Apply button via JS fallback")
+            return "js"
+        return None
+
+    def select_home_type(self, home_type):
+        """
+        Show the results for home_type (None = no type filter).
+        With config.direct_urls, the filtered URL is loaded directly once the
+        URL template has been verified against the UI flow; until then (or if
+        verification fails) the checkbox/Apply flow below is used.
+        Returns True once filtered results are on the page, False otherwise.
+        """
+        self.home_type = home_type
+        if self.config.direct_urls and self.urls.filter_verified and self.urls.can_filter(home_type):
+            with trace.span("filter_url", home_type=home_type) as s:
+                loaded = self.load_results_url(self.urls.build(home_type))
+                s["outcome"] = "loaded" if loaded else "no_results"
+            if loaded:
+                log.info("Loaded filtered results directly for: %s", home_type)
+                return True
+            log.warning("Direct filter URL showed no results — using the filter UI")
+
+        if not self.apply_filter(home_type):
+            return False
+        if self.config.direct_urls and not self.urls.filter_verified and not self.urls.failed:
+            return self.verify_filter_url(home_type)
+        return True
+
+    def apply_filter(self, home_type):
+        """select_home_type_ui() as one paced request, retried if no results appear."""
+        return self.browser.pacer.run("filter", partial(self.select_home_type_ui, home_type))
+
+    def load_results_url(self, url, budget=2):
+        """
+        Load a results URL and wait for offer cards (paced, retried if none
+        appear). Returns True if cards appeared.
+        """
+        return self.browser.pacer.run("results_page", partial(self._load_results_url, url, budget))
+
+    def _load_results_url(self, url, budget):
+        self.driver.get(url)
+        try:
+            self.browser.wait_for("results", EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SELECTOR)))
+        except TimeoutException:
+            return False
+        self.ready.settle(budget)
+        return True
+
+    def verify_filter_url(self, home_type):
+        """
+        Learn the filter URL template from the page the UI produced and check
+        that loading it directly shows the same cards. Returns False if the
+        check failed and the UI result could not be put back on the page.
+        """
+        if home_type is not None:
+            self.urls.learn_filter(home_type, self.driver.current_url)
+            if not self.urls.template:
+                return True
+        ui_cards = self.ready.card_signature()
+        with trace.span("filter_url_verify", home_type=home_type) as s:
+            url = self.urls.build(home_type)
+            if self.load_results_url(url) and self.ready.card_signature() == ui_cards:
+                self.urls.filter_verified = True
+                s["outcome"] = "verified"
+                log.info("Filter URL verified: %s", url)
+                return True
+            s["outcome"] = "mismatch"
+        log.warning("Filter URL does not reproduce the UI result — keeping the click flow")
+        self.urls.failed = True
+        # put the UI result back on the page for the crawl
+        if not self.apply_filter(home_type):
+            log.warning("Could not restore the filtered results for '%s' — skipping this type", home_type)
+            return False
+        return True
+
+    def verify_page_url(self, page):
+        """Check that the learned page URL shows the cards the click produced."""
+        clicked_cards = self.ready.card_signature()
+        with trace.span("page_url_verify", page=page) as s:
+            url = self.urls.build(self.home_type, page)
+            if self.load_results_url(url) and self.ready.card_signature() == clicked_cards:
+                self.urls.page_verified = True
+                s["outcome"] = "verified"
+                log.info("Page URL verified: %s", url)
+                return True
+            s["outcome"] = "mismatch"
+        log.warning("Page URL does not reproduce the clicked page — keeping the click flow")
+        self.urls.failed = True
+        return False
+
+    def select_home_type_ui(self, home_type):
+        """
+        Reload the base page, tick the q-checkbox for home_type and apply the filter.
+        Pass home_type=None to apply no type filter at all. Call it through
+        apply_filter() so the reload is paced.
+        Returns True once filtered results are on the page, EMPTY if the filter
+        was applied and the page settled without any (nothing to retry), False
+        otherwise.
+        """
+        # reload base page to clear previous filters
+        self.driver.get(self.config.base_url)
+        self.ready.settle(2)
+        # accept cookies if necessary (some sites clear cookie banner on reload)
+        try:
+            self.accept_cookies_once()
+        except Exception:
+            pass
+
+        if home_type is None:
+            checkbox_clicked = True
+        else:
+            with trace.span("checkbox", home_type=home_type) as s:
+                checkbox_clicked = self.click_home_type_checkbox(home_type)
+                s["strategy"] = checkbox_clicked or "none"
+
+        if not checkbox_clicked:
+            log.warning("Checkbox for '%s' not found — continuing without this filter", home_type)
+            # continue to try Apply anyway
+
+        self.ready.settle(0.8)
+
+        # Click apply button (robust)
+        with trace.span("apply_button") as s:
+            clicked_apply = self.click_apply_button()
+            s["strategy"] = clicked_apply or "none"
+        if not clicked_apply:
+            log.warning("Could not click Apply — continuing to next home type")
+            return False
+
+        # Wait for filtered results to appear
+        try:
+            # Wait until at least one offer-card is present (or timeout)
+            self.browser.wait_for("results", EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SELECTOR)))
+            self.ready.settle(1)  # small buffer
+            log.info("Filtered results loaded")
+        except TimeoutException:
+            if checkbox_clicked and self.ready.settle(2):
+                log.info("No listings for this filter — skipping this type")
+                return EMPTY
+            log.warning("No filtered results loaded for this filter — skipping this type")
+            return False
+        return True
+
+    def click_home_type_checkbox(self, home_type):
+        """
+        Find and click the q-checkbox whose label matches home_type.
+        Tries exact text, then partial (case-insensitive) text, then a label scan,
+        starting with whichever worked last time (see StrategyCache); only that
+        first attempt gets the full "checkbox" wait budget.
+        Returns the strategy that clicked ("exact", "exact_js", "partial",
+        "label_scan"), or None.
+        """
+        return self.strategies.run("checkbox", self._budgeted("checkbox", {
+            "exact": partial(self._click_checkbox_exact, home_type),
+            "partial": partial(self._click_checkbox_partial, home_type),
+            "label_scan": partial(self._click_checkbox_label_scan, home_type),
+        }, "checkbox"))
+
+    def _click_checkbox_exact(self, home_type, step):
+        driver = self.driver
+        # build robust XPath to find checkbox container which has the label text inside (handles nested tags)
+        # This looks for a q-checkbox div that contains any descendant with text equal to the home_type
+        checkbox_xpath = f"//div[contains(@class,'q-checkbox')][.//text()[normalize-space(.) = '{home_type}']]"
+        try:
+            checkbox = self.browser.wait_for(step, EC.presence_of_element_located((By.XPATH, checkbox_xpath)))
+        except TimeoutException:
+            return None
+        # ensure it is clickable
+        try:
+            self.browser.wait_for(step, EC.element_to_be_clickable((By.XPATH, checkbox_xpath)))
+            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", checkbox)
+            try:
+                checkbox.click()
+            except ElementClickInterceptedException:
+                driver.execute_script("arguments[0].click();", checkbox)
+            log.info("Clicked checkbox (exact match) for: %s", home_type)
+            return "exact"
+        except TimeoutException:
+            # try click via JS
+            driver.execute_script("arguments[0].scrollIntoView({block:'center'}); arguments[0].click();", checkbox)
+            log.info("Clicked checkbox via JS (exact match) for: %s", home_type)
+            return "exact_js"
+
+    def _click_checkbox_partial(self, home_type, step):
+        driver = self.driver
+        # Alternate fallback: match by partial text (case-insensitive)
+        checkbox_partial_xpath = f"//div[contains(@class,'q-checkbox')][.//text()[contains(normalize-space(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')), '{home_type.lower()}')]]"
+        try:
+            checkbox = self.browser.wait_for(step, EC.presence_of_element_located((By.XPATH, checkbox_partial_xpath)))
+        except TimeoutException:
+            return None
+        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", checkbox)
+        try:
+            checkbox.click()
+        except ElementClickInterceptedException:
+            driver.execute_script("arguments[0].click();", checkbox)
+        log.info("Clicked checkbox (partial match) for: %s", home_type)
+        return "partial"
+
+    def _click_checkbox_label_scan(self, home_type, step):
+        driver = self.driver
+        # last resort: iterate labels and compare text
+        try:
+            labels = self.browser.wait_for(step, EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.q-checkbox__label")))
+        except TimeoutException:
+            return None
+        for lbl in labels:
+            try:
+                txt = lbl.text.strip()
+                if txt and txt.lower() == home_type.lower():
+                    # parent q-checkbox container
+                    cont = lbl.find_element(By.XPATH, "./ancestor::div[contains(@class,'q-checkbox')]")
+                    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", cont)
+                    try:
+                        cont.click()
+                    except ElementClickInterceptedException:
+                        driver.execute_script("arguments[0].click();", cont)
+                    log.info("Clicked checkbox via label scan for: %s", home_type)
+                    return "label_scan"
+            except StaleElementReferenceException:
+                continue
+        return None
+
+    def crawl_results(self, known=None, first_page=1, on_page=None):
+        """
+        Collect the listings of the current filter: from the JSON feed when
+        config.data_source is "feed" (falling back to the DOM if no usable feed
+        is found), otherwise by paging through the rendered cards.
+        first_page is the page already on screen (see skip_to_page()); on_page,
+        if given, is called as on_page(page, cards) after every page.
+        Returns (cards, complete) as crawl_dom() does; unusable cards are kept
+        with their reason in self.rejected[home_type].
+        """
+        self.rejected[self.home_type] = []
+        if self.config.data_source == "feed":
+            with trace.span("feed_crawl") as s:
+                found = self.crawl_feed(known, on_page)
+                s["outcome"] = "feed" if found is not None else "dom_fallback"
+            if found is not None:
+                return found
+            log.warning("No usable listing feed found — falling back to the rendered cards")
+        return self.crawl_dom(known, first_page, on_page)
+
+    def skip_to_page(self, page):
+        """
+        Bring the current filter's results to page without reading the pages
+        before it (used when resuming a crawl). Returns True if page is shown.
+        """
+        with trace.span("page_skip", page=page) as s:
+            if self.config.direct_urls and self.urls.page_verified and self.urls.can_page():
+                reached = self.load_results_url(self.urls.build(self.home_type, page))
+            else:
+                reached = True
+                for _ in range(page - 1):
+                    if self.next_page_state() != "enabled":
+                        reached = False
+                        break
+                    previous_cards = self.ready.card_signature()
+                    if not self.browser.pacer.run("next_page", partial(self.turn_page, previous_cards)):
+                        reached = False
+                        break
+            s["outcome"] = "reached" if reached else "failed"
+        return reached
+
+    def capture_feed(self):
+        """
+        Return (feed_url, payload) for the latest JSON response captured in the
+        performance log that contains listings, else (None, window.__NUXT__).
+        """
+        responses = []
+        for m in self.browser.performance_entries():
+            if m.get("method") != "Network.responseReceived":
+                continue
+            params = m["params"]
+            response = params.get("response", {})
+            if params.get("type") in ("XHR", "Fetch") and "json" in response.get("mimeType", ""):
+                responses.append((params["requestId"], response.get("url")))
+        for request_id, url in reversed(responses):
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                payload = json.loads(body.get("body") or "null")
+            except Exception:
+                continue
+            if feed.find_listing_list(payload):
+                return url, payload
+        try:
+            return None, json.loads(self.driver.execute_script(NUXT_PAYLOAD_JS) or "null")
+        except Exception:
+            return None, None
+
+    def fetch_feed_page(self, url):
+        """Fetch one feed page in the page (paced, retried); None if it failed."""
+        return self.browser.pacer.run("feed_page", partial(self._fetch_feed_page, url))
+
+    def _fetch_feed_page(self, url):
+        try:
+            return json.loads(self.driver.execute_async_script(FETCH_JSON_JS, url) or "null")
+        except Exception as e:
+            log.warning("Feed page fetch failed: %s", e)
+            return None
+
+    def crawl_feed(self, known=None, on_page=None):
+        """
+        Read listings, pagination and exact numeric fields from the JSON the
+        page loaded for the current filter, then fetch later pages by replaying
+        that request with a different page number (one in-page fetch per page).
+        Returns (cards, complete), or None when no usable feed was found.
+        """
+        feed_url, payload = self.capture_feed()
+        items = feed.find_listing_list(payload)
+        if not items:
+            return None
+        # Learn how items map to listing URLs from the cards rendered for them
+        hrefs = self.ready.card_signature() or []
+        link = feed.learn_link(items, hrefs)
+        if link is None:
+            log.warning("Feed items do not line up with the rendered cards")
+            return None
+        page, pages = feed.find_pagination(payload)
+        if (pages or 1) > 1 and (feed_url is None or feed.page_url(feed_url, 2) is None):
+            log.warning("Feed has no page parameter to follow")
+            return None
+        page = page or 1
+
+        listings = []
+        while True:
+            cards = [feed.feed_card(item, link) for item in items]
+            log.info("➡ Feed page %s/%s: %s listings", page, pages or 1, len(cards))
+            page_listings = []
+            for card in cards:
+                problem = card_problem(card)
+                if problem:
+                    self.rejected[self.home_type].append((card, problem))
+                else:
+                    page_listings.append(card)
+            listings.extend(page_listings)
+            if on_page:
+                on_page(page, page_listings)
+            if known is not None and cards and all(c["href"] in known for c in cards):
+                log.info("⏹ Page contains only known listings — stopping incremental crawl")
+                return listings, False
+            if page >= (pages or 1):
+                return listings, True
+            page += 1
+            with trace.span("page_fetch", page=page, strategy="feed") as s:
+                payload = self.fetch_feed_page(feed.page_url(feed_url, page))
+                items = feed.find_listing_list(payload)
+                s["cards"] = len(items)
+            if not items:
+                log.warning("⚠ Feed page %s returned no listings — stopping", page)
+                return listings, False
+
+    def next_page_button(self):
+        """The enabled 'Volgende' button, or None (no waiting)."""
+        for btn in self.driver.find_elements(By.XPATH, NEXT_XPATH):
+            # disabled via attribute or CSS class
+            if not (btn.get_attribute("disabled") or "disabled" in (btn.get_attribute("class") or "").lower()):
+                return btn
+        return None
+
+    def next_page_state(self):
+        """
+        "enabled", "disabled" (the last page) or "missing" when no 'Volgende'
+        button rendered within the paginator's budget. Only "disabled" proves
+        the last page: a paginator can render a moment after the cards.
+        """
+        try:
+            self.browser.wait_for("paginator", EC.presence_of_element_located((By.XPATH, NEXT_XPATH)))
+        except TimeoutException:
+            return "missing"
+        return "enabled" if self.next_page_button() is not None else "disabled"
+
+    def turn_page(self, previous_cards):
+        """
+        Click 'Volgende' and wait for a different card set. Returns how it
+        clicked ("click" / "js"), "late" if an earlier click landed after all,
+        or None if the cards did not change.
+        """
+        current = self.ready.card_signature()
+        if current and current != previous_cards:
+            return "late"
+        next_btn = self.next_page_button()
+        if next_btn is None:
+            return None
+        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", next_btn)
+        try:
+            next_btn.click()
+            log.info("➡ Next page clicked")
+            strategy = "click"
+        except ElementClickInterceptedException:
+            self.driver.execute_script("arguments[0].click();", next_btn)
+            log.info("➡ Next page clicked via JS fallback")
+            strategy = "js"
+        return strategy if self.ready.wait_for_cards_change(previous_cards) else None
+
+    def crawl_dom(self, known=None, first_page=1, on_page=None):
+        """
+        Walk every results page (via the 'Volgende' button) and return
+        (cards, complete): all parsed cards that have a price and a living area,
+        and whether the last page was reached.
+        If known (a set of listing URLs) is given, paging stops after the first
+        page whose cards are all already known. first_page is the number of the
+        page currently shown; on_page(page, cards) is called after each page.
+        """
+        driver = self.driver
+        listings = []
+        complete = False
+        page = first_page
+        try:
+            while True:  # LOOP ALL PAGES
+                with trace.span("card_extraction", page=page) as s:
+                    cards = extract_cards(driver)
+                    s["cards"] = len(cards)
+                log.info("➡ Found %s cards on this page", len(cards))
+
+                page_listings = []
+                # per-card details only at debug level; %-args are not formatted otherwise
+                for card in cards:
+                    log.debug("card complete data:\n%s", card["text"])
+                    log.debug("→ Price via %s: %s", card["price_source"], card["price"])
+                    log.debug("→ Living Area: %s", card["living_area"])
+                    log.debug("→ Bedrooms: %s", card["bedrooms"])
+
+                    problem = card_problem(card)
+                    if problem:
+                        log.debug("⚠ %s → skipping card", problem)
+                        self.rejected[self.home_type].append((card, problem))
+                        continue
+                    page_listings.append(card)
+                listings.extend(page_listings)
+                if on_page:
+                    on_page(page, page_listings)
+
+                if known is not None and cards and all(c["href"] in known for c in cards):
+                    log.info("⏹ Page contains only known listings — stopping incremental crawl")
+                    break
+
+                expired = self.browser.timeouts.expired()
+                if expired:
+                    log.warning("⏱ %s deadline reached after page %s — stopping", expired.name, page)
+                    break
+
+                # ================================
+                # CHECK NEXT PAGE
+                # ================================
+                # Only a disabled button marks the last page; a paginator that never
+                # rendered stops the crawl without claiming it was complete.
+                state = self.next_page_state()
+                if state == "disabled":
+                    log.info("⛔ Next page button is disabled — reached last page")
+                    complete = True
+                    break  # exit your while loop here
+                if state == "missing":
+                    log.warning("⚠ No next page button after page %s — stopping (crawl not complete)", page)
+                    break
+
+                page += 1
+                if self.config.direct_urls and self.urls.page_verified and self.urls.can_page():
+                    # the next page is reached by URL, so a fresh Chrome loses nothing here
+                    if self.browser.watchdog.check():
+                        driver = self.driver
+                    with trace.span("page_fetch", page=page, strategy="url") as s:
+                        if self.load_results_url(self.urls.build(self.home_type, page)):
+                            log.info("➡ Page %s loaded directly", page)
+                            s["outcome"] = "changed"
+                        else:
+                            log.warning("⚠ Page %s URL showed no cards — stopping", page)
+                            s["outcome"] = "no_results"
+                            break
+                    continue
+
+                # a fresh Chrome opens blank: filter again and page back to where we were
+                if self.browser.watchdog.check():
+                    driver = self.driver
+                    if not (self.select_home_type(self.home_type) and self.skip_to_page(page - 1)):
+                        log.warning("⚠ Could not return to page %s after recycling Chrome — stopping", page - 1)
+                        break
+                    log.info("Back on page %s after recycling Chrome", page - 1)
+
+                # Scroll into view and click (paced; retried if the cards do not change)
+                with trace.span("page_fetch", page=page) as s:
+                    url_before = driver.current_url
+                    previous_cards = self.ready.card_signature()
+                    strategy = self.browser.pacer.run("next_page", partial(self.turn_page, previous_cards))
+                    s["strategy"] = strategy or "none"
+                    s["outcome"] = "changed" if strategy else "unchanged"
+                if not strategy:
+                    log.warning("⚠ Cards did not change after paging — stopping")
+                    break
+
+                if (self.config.direct_urls and not self.urls.page_verified and not self.urls.failed
+                        and self.urls.can_filter(self.home_type)
+                        and self.urls.learn_page(url_before, driver.current_url, page)):
+                    self.verify_page_url(page)
+
+        except Exception as e:
+            log.error("Error collecting listings: %s", e)
+        return listings, complete
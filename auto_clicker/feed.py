@@ -0,0 +1,138 @@
+"""
+Listing data feed: reads listings from the JSON the Nuxt app already loads
+(the XHR/fetch behind the filter and pagination, or window.__NUXT__) instead
+of scraping rendered offer cards.
+
+The site's schema is not documented, so listings are found by shape: the
+largest list of objects carrying a price-like key. Field names are matched
+against a few known spellings, and listing URLs are learned by lining the
+first feed page up with the hrefs of the cards rendered on that page.
+Everything here is pure Python; the crawler supplies the JSON.
+"""
+import re
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+PRICE_KEYS = ("price", "rent", "rentalPrice", "rental_price", "totalRent", "total_rent", "huurprijs", "priceTotal")
+AREA_KEYS = ("area", "livingArea", "living_area", "surface", "surfaceArea", "woonoppervlakte", "size")
+BEDROOM_KEYS = ("bedrooms", "bedroomCount", "bedroom_count", "slaapkamers", "numberOfBedrooms")
+TYPE_KEYS = ("type", "homeType", "home_type", "propertyType", "objectType", "woningtype", "category")
+LINK_KEYS = ("url", "href", "link", "permalink", "slug", "id", "uuid")
+PAGE_KEYS = ("page", "currentPage", "current_page", "pageNumber")
+PAGES_KEYS = ("pages", "totalPages", "total_pages", "last_page", "lastPage", "pageCount")
+PAGE_PARAMS = ("page", "p", "pagina", "pageNumber", "currentPage")
+
+NUMBER_RE = re.compile(r"\d[\d.,]*")
+DOT_THOUSANDS_RE = re.compile(r"\d{1,3}(?:\.\d{3})+(?:,\d*)?$")
+COMMA_THOUSANDS_RE = re.compile(r"\d{1,3}(?:,\d{3})+(?:\.\d*)?$")
+
+def _first(item, keys):
+    for key in keys:
+        if key in item and item[key] not in (None, ""):
+            return item[key]
+    return None
+
+def _number(value):
+    """
+    Return an int from 1250, 1250.0, "1250.00", "75.5", "1.250", "€ 1.250,- p/m",
+    "1,250" or {"amount": 1250}; None otherwise. A dot is only a thousands
+    separator in the "1.250" form; decimals are dropped.
+    """
+    if isinstance(value, dict):
+        value = _first(value, ("amount", "value", "total"))
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = NUMBER_RE.search(str(value))
+    if not match:
+        return None
+    number = match.group(0).rstrip(".,")
+    if DOT_THOUSANDS_RE.match(number):  # "1.250", "1.250,00"
+        return int(number.split(",")[0].replace(".", ""))
+    if COMMA_THOUSANDS_RE.match(number):  # "1,250", "1,250.00"
+        return int(float(number.replace(",", "")))
+    try:  # "1250", "1250.00", "75.5", "75,5"
+        return int(float(number.replace(",", ".")))
+    except ValueError:
+        return None
+
+def _text(value):
+    """Return a label from "Studio" or {"name": "Studio"}; None otherwise."""
+    if isinstance(value, dict):
+        value = _first(value, ("name", "label", "title", "value"))
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+def find_listing_list(payload):
+    """Return the largest list of dicts in payload whose items carry a price-like key."""
+    best = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            dicts = [x for x in node if isinstance(x, dict)]
+            if dicts and len(dicts) > len(best) and all(_first(x, PRICE_KEYS) is not None for x in dicts):
+                best = dicts
+            stack.extend(node)
+    return best
+
+def find_pagination(payload):
+    """Return (page, pages) from the first dict that has both, or (None, None)."""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            page, pages = _number(_first(node, PAGE_KEYS)), _number(_first(node, PAGES_KEYS))
+            if page is not None and pages is not None:
+                return page, pages
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return None, None
+
+def learn_link(items, hrefs):
+    """
+    Work out how feed items map to listing URLs from one page of items and
+    the hrefs of the cards rendered for it. Returns (key, prefix) such that
+    href == prefix + str(item[key]) for every item, or None.
+    """
+    if not items or len(items) != len(hrefs):
+        return None
+    for key in LINK_KEYS:
+        values = [item.get(key) for item in items]
+        if any(v in (None, "") for v in values):
+            continue
+        values = [str(v) for v in values]
+        if all(href == value for href, value in zip(hrefs, values)):
+            return key, ""
+        first_href, first_value = hrefs[0], values[0]
+        if not first_href.endswith(first_value):
+            continue
+        prefix = first_href[:len(first_href) - len(first_value)]
+        if all(href == prefix + value for href, value in zip(hrefs, values)):
+            return key, prefix
+    return None
+
+def feed_card(item, link):
+    """Build a card dict (same keys as cards.parse_card) from one feed item."""
+    key, prefix = link
+    return {
+        "price": _number(_first(item, PRICE_KEYS)),
+        "price_source": "feed",
+        "living_area": _number(_first(item, AREA_KEYS)),
+        "bedrooms": _number(_first(item, BEDROOM_KEYS)) or 1,
+        "home_type": _text(_first(item, TYPE_KEYS)),
+        "href": prefix + str(item[key]) if item.get(key) not in (None, "") else None,
+        "text": "",
+    }
+
+def page_url(feed_url, page):
+    """Return feed_url with its page parameter set to page, or None if it has none."""
+    parts = urlparse(feed_url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    for name in PAGE_PARAMS:
+        if name in query:
+            query[name] = [str(page)]
+            return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+    return None
@@ -0,0 +1,132 @@
+"""
+Run journal for crash-safe resume.
+
+Progress is written to a JSON file (atomically, like the snapshot) as the run
+goes: the cards of every fully crawled home type, the pages crawled so far
+for the home type in progress, the row being processed and the state of each
+listing submission. With --resume the next run continues from there instead
+of starting again at row 1, page 1. The journal is removed when a run
+finishes; it is discarded when the sheet rows or crawl settings changed.
+
+A listing is marked "pending" before it is submitted. A pending listing found
+on resume was interrupted mid-submission and is tried again.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+
+from .atomic import atomic_write_json
+
+log = logging.getLogger(__name__)
+
+class RunJournal:
+
+    def __init__(self, path):
+        self.path = path
+        self.data = self._empty(None)
+        self.results = {}  # sheet row number -> {"matched", "submitted", "failed"}
+
+    @staticmethod
+    def _empty(signature):
+        return {
+            "signature": signature,
+            "started_at": time.time(),
+            "crawled": {},  # home type key -> indexed cards
+            "crawling": None,  # {"key", "page", "cards"} for the home type in progress
+            "row": None,
+            "listings": {},  # row idx -> {listing_url: "pending" | outcome}
+            "results": {},
+        }
+
+    @staticmethod
+    def signature(sheet_rows, config):
+        """Hash of everything that decides what a run crawls and submits."""
+        blob = json.dumps([sheet_rows, config.base_url, config.crawl_unfiltered], sort_keys=True, default=str)
+        return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+    def start(self, sheet_rows, config, resume=False):
+        """
+        Begin journaling a run. With resume, the saved journal is picked up if
+        it belongs to the same sheet rows and settings. Returns True if resumed.
+        """
+        signature = self.signature(sheet_rows, config)
+        if resume:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    saved = json.load(f)
+            except (OSError, ValueError):
+                saved = None
+            if saved is None:
+                log.info("No run journal to resume — starting a fresh run")
+            elif saved.get("signature") != signature:
+                log.info("Run journal belongs to different sheet rows or settings — starting a fresh run")
+            else:
+                self.data = saved
+                self.results = {int(k): v for k, v in saved["results"].items()}
+                return True
+        self.data = self._empty(signature)
+        self.results = {}
+        self.save()
+        return False
+
+    # --- crawl progress ---
+
+    def crawled_cards(self, key):
+        """Indexed cards of a home type crawled to the end, or None."""
+        return self.data["crawled"].get(key)
+
+    def crawl_progress(self, key):
+        """Return (last crawled page, cards so far) for key, or (0, [])."""
+        crawling = self.data["crawling"]
+        if crawling and crawling["key"] == key:
+            return crawling["page"], list(crawling["cards"])
+        return 0, []
+
+    def page_done(self, key, page, cards):
+        crawling = self.data["crawling"]
+        if not crawling or crawling["key"] != key:
+            crawling = self.data["crawling"] = {"key": key, "page": 0, "cards": []}
+        crawling["page"] = page
+        crawling["cards"].extend({k: v for k, v in card.items() if k != "text"} for card in cards)
+        self.save()
+
+    def restart_crawl(self, key):
+        """Forget the partial pages of key (they are crawled again from page 1)."""
+        if self.data["crawling"] and self.data["crawling"]["key"] == key:
+            self.data["crawling"] = None
+            self.save()
+
+    def crawl_done(self, key, cards):
+        self.data["crawled"][key] = [{k: v for k, v in card.items() if k != "text"} for card in cards]
+        self.data["crawling"] = None
+        self.save()
+
+    # --- submission progress ---
+
+    def row_started(self, idx):
+        self.data["row"] = idx
+        self.save()
+
+    def listing_state(self, idx, listing_url):
+        return self.data["listings"].get(str(idx), {}).get(listing_url)
+
+    def listing_started(self, idx, listing_url):
+        self.data["listings"].setdefault(str(idx), {})[listing_url] = "pending"
+        self.save()
+
+    def listing_done(self, idx, listing_url, outcome):
+        self.data["listings"].setdefault(str(idx), {})[listing_url] = outcome
+        self.save()
+
+    def save(self):
+        self.data["results"] = {str(k): v for k, v in self.results.items()}
+        atomic_write_json(self.path, self.data, ensure_ascii=False)
+
+    def finish(self):
+        """The run completed: nothing left to resume."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
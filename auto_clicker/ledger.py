@@ -0,0 +1,43 @@
+import sqlite3
+import time
+
+class SubmissionLedger:
+    """
+    SQLite-backed record of every (listing URL, applicant email) pair that was
+    submitted, so reruns and overlapping rows skip listings already handled.
+    Only "thank_you" and "no_redirect" outcomes count as done; "failed" and
+    "skipped" are recorded but retried on the next run.
+    """
+
+    DONE_OUTCOMES = ("thank_you", "no_redirect")
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS submissions ("
+            " listing_url TEXT NOT NULL,"
+            " email TEXT NOT NULL,"
+            " outcome TEXT NOT NULL,"
+            " thank_you INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (listing_url, email))"
+        )
+        self.conn.commit()
+
+    def is_done(self, listing_url, email):
+        cur = self.conn.execute(
+            "SELECT outcome FROM submissions WHERE listing_url = ? AND email = ?",
+            (listing_url, email.lower()),
+        )
+        found = cur.fetchone()
+        return found is not None and found[0] in self.DONE_OUTCOMES
+
+    def record(self, listing_url, email, outcome):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO submissions VALUES (?, ?, ?, ?, ?)",
+            (listing_url, email.lower(), outcome, int(outcome == "thank_you"), time.time()),
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,95 @@
+"""
+Listing-page metadata cache.
+
+What a listing page looked like the last time it was opened: whether it still
+takes applications ("open"), has no 'Ik heb interesse' button any more
+("closed") or no subscription form behind the button ("no_form"), plus the
+IDs of the form's input fields and toggles. Closed listings and listings
+without a form are skipped without loading the page again, and the form of an
+open listing is prepared from its cached IDs before navigation.
+
+Entries expire after a TTL and the cache keeps at most max_entries listings
+(least recently used are evicted first). It is persisted as JSON, like the
+strategy cache; hit, miss and eviction counts are reported per run.
+"""
+import json
+import logging
+import time
+from collections import OrderedDict
+
+from .atomic import atomic_write_json
+
+log = logging.getLogger(__name__)
+
+OPEN, CLOSED, NO_FORM = "open", "closed", "no_form"
+SKIP_STATUSES = (CLOSED, NO_FORM)
+
+class ListingCache:
+
+    def __init__(self, path, ttl, max_entries):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # listing_url -> metadata, least recently used first
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.entries.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        self.reset()
+
+    def reset(self):
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0, "skipped": 0}
+
+    def get(self, listing_url):
+        """Return the cached metadata of listing_url, or None if unknown or expired."""
+        meta = self.entries.get(listing_url)
+        if meta is not None and time.time() - meta["checked_at"] > self.ttl:
+            del self.entries[listing_url]
+            self.stats["expired"] += 1
+            meta = None
+        if meta is None:
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(listing_url)
+        self.stats["hits"] += 1
+        return meta
+
+    def put(self, listing_url, status, fields=(), toggles=()):
+        self.entries[listing_url] = {
+            "status": status,
+            "interest_button": status != CLOSED,
+            "form": status == OPEN,
+            "fields": list(fields),
+            "toggles": list(toggles),
+            "checked_at": time.time(),
+        }
+        self.entries.move_to_end(listing_url)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evicted"] += 1
+
+    def skip_reason(self, meta):
+        """Why a listing with this cached metadata need not be opened, or None."""
+        if meta is None or meta["status"] not in SKIP_STATUSES:
+            return None
+        self.stats["skipped"] += 1
+        age = (time.time() - meta["checked_at"]) / 60
+        if meta["status"] == CLOSED:
+            return f"no 'Ik heb interesse' button {age:.0f} min ago"
+        return f"no subscription form {age:.0f} min ago"
+
+    def save(self):
+        atomic_write_json(self.path, self.entries, indent=1)
+
+    def report(self):
+        st = self.stats
+        lookups = st["hits"] + st["misses"]
+        if not lookups:
+            return
+        log.info(
+            "Listing cache: %s/%s hits (%.0f%%), %s misses (%s expired), %s evicted,"
+            " %s listings skipped unopened; %s cached",
+            st["hits"], lookups, 100 * st["hits"] / lookups, st["misses"], st["expired"], st["evicted"],
+            st["skipped"], len(self.entries)
+        )
@@ -0,0 +1,37 @@
+import bisect
+
+class ListingIndex:
+    """
+    In-memory index of crawled cards, sorted by (price, living_area, bedrooms),
+    so every sheet row can be answered with a range query instead of a re-crawl.
+    """
+
+    def __init__(self, cards=()):
+        self.cards = []
+        self.prices = []
+        seen = set()
+        for card in sorted(cards, key=lambda c: (c["price"], c["living_area"], c["bedrooms"])):
+            if card["href"] in seen:
+                continue
+            seen.add(card["href"])
+            self.cards.append(card)
+            self.prices.append(card["price"])
+
+    def __len__(self):
+        return len(self.cards)
+
+    def query(self, max_price, max_area, max_rooms, home_type=None):
+        """
+        Return the cards with price <= max_price, area <= max_area and
+        bedrooms <= max_rooms. With home_type (an index of the unfiltered
+        list), only cards of that home type; cards without one never match.
+        """
+        end = bisect.bisect_right(self.prices, max_price)
+        return [
+            c for c in self.cards[:end]
+            if c["living_area"] <= max_area and c["bedrooms"] <= max_rooms
+            and (home_type is None or same_home_type(c.get("home_type"), home_type))
+        ]
+
+def same_home_type(card_type, home_type):
+    return bool(card_type) and card_type.strip().casefold() == home_type.strip().casefold()
@@ -0,0 +1,73 @@
+"""
+Logging setup for the command line.
+
+Every module logs through its own logger ("auto_clicker.crawler",
+"auto_clicker.submitter", ...). setup_logging() puts a QueueHandler on the
+package logger, so a log call in the crawl loop only enqueues the record; a
+QueueListener thread does the formatting and the actual write, which may be
+slow on a terminal or a container log driver. With json_output each record
+is one JSON line. Log calls pass %-style arguments, so records below the
+level are never formatted at all.
+"""
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+LEVELS = ("debug", "info", "warning", "error")
+
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: ts, level, logger, msg (and exc)."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records without formatting them on the calling thread. The stock
+    prepare() runs the formatter here and drops exc_info, which would put
+    tracebacks into "msg" and leave JsonFormatter's "exc" empty. Only the
+    %-arguments are merged, so later changes to them do not alter the message.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+def setup_logging(level="info", json_output=False, stream=None):
+    """Route the package's log records through a queue to stream (stdout)."""
+    global _listener
+    stop_logging()
+    handler = logging.StreamHandler(stream or sys.stdout)
+    if json_output:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname).1s %(name)s: %(message)s", "%H:%M:%S"))
+    records = queue.SimpleQueue()
+    package = logging.getLogger("auto_clicker")
+    package.handlers[:] = [RecordQueueHandler(records)]
+    package.setLevel(level.upper())
+    package.propagate = False
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,132 @@
+"""
+Adaptive request pacing for page loads, pagination clicks and feed fetches.
+
+Every request to the site goes through Pacer.run(), which:
+  - keeps requests at least 60 / config.max_requests_per_minute seconds apart,
+  - tracks the latency and outcome of the last PACING_WINDOW requests of each
+    kind (a page turn, the filter flow and a listing open take very different
+    times) and adds a growing delay (backoff) while requests fail, a kind's
+    error rate is high or its loads are SLOW_FACTOR times slower than at the
+    start of the session,
+  - retries a failed request up to config.page_retries times after a jittered,
+    exponentially growing pause, instead of skipping the page.
+
+An attempt that worked but found nothing (a home type without listings)
+returns EMPTY: it is neither retried nor counted as a failure.
+"""
+import logging
+import random
+import statistics
+import time
+from collections import deque
+
+from . import trace
+
+log = logging.getLogger(__name__)
+
+PACING_WINDOW = 8  # recent requests used for latency / error rate
+SLOW_FACTOR = 2.0  # median latency vs. the session's first window
+MAX_ERROR_RATE = 0.25
+BACKOFF_STEP = 1.0  # seconds added on the first sign of trouble, doubled after that
+MAX_BACKOFF = 30.0
+RETRY_BASE = 2.0  # seconds before the first retry (jittered, doubled per retry)
+
+class _Empty:
+    """Falsy result of a request that succeeded but found nothing."""
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "EMPTY"
+
+EMPTY = _Empty()
+
+class Pacer:
+
+    def __init__(self, config):
+        rate = config.max_requests_per_minute
+        self.min_interval = 60.0 / rate if rate else 0.0
+        self.retries = config.page_retries
+        self.recent = {}  # kind -> deque of (seconds, ok)
+        self.baselines = {}  # kind -> median latency of its first full window
+        self.backoff = 0.0
+        self.last = 0.0
+        self.reset()
+
+    def reset(self):
+        self.stats = {"requests": 0, "failures": 0, "empty": 0, "retries": 0, "recovered": 0,
+                      "paced": 0.0, "max_backoff": 0.0}
+
+    def wait_turn(self):
+        """Sleep until the rate ceiling and the current backoff allow the next request."""
+        delay = self.last + self.min_interval + self.backoff - time.time()
+        if delay > 0:
+            time.sleep(delay)
+            self.stats["paced"] += delay
+        self.last = time.time()
+
+    def record(self, kind, seconds, ok):
+        self.stats["requests"] += 1
+        if not ok:
+            self.stats["failures"] += 1
+        recent = self.recent.setdefault(kind, deque(maxlen=PACING_WINDOW))
+        recent.append((seconds, ok))
+        latencies = [s for s, good in recent if good]
+        baseline = self.baselines.get(kind)
+        if baseline is None and len(latencies) == PACING_WINDOW:
+            baseline = self.baselines[kind] = statistics.median(latencies)
+        error_rate = sum(1 for _, good in recent if not good) / len(recent)
+        slow = bool(baseline and latencies and statistics.median(latencies) > baseline * SLOW_FACTOR)
+        failing = error_rate > MAX_ERROR_RATE and len(recent) >= PACING_WINDOW // 2
+        if not ok or slow or failing:
+            self.backoff = min(MAX_BACKOFF, max(BACKOFF_STEP, self.backoff * 2))
+            self.stats["max_backoff"] = max(self.stats["max_backoff"], self.backoff)
+        elif self.backoff:
+            self.backoff = self.backoff / 2 if self.backoff > BACKOFF_STEP else 0.0
+
+    def run(self, kind, attempt, retries=None):
+        """
+        Call attempt() (one request plus its wait) in its turn. A falsy result
+        or an exception counts as a failure and is retried; returns the first
+        truthy result or EMPTY, else the last result (or re-raises the last
+        exception).
+        """
+        retries = self.retries if retries is None else retries
+        for n in range(retries + 1):
+            if n:
+                pause = random.uniform(0.5, 1.5) * RETRY_BASE * 2 ** (n - 1)
+                log.warning("↻ Retrying %s (%s/%s) in %.1fs", kind, n, retries, pause)
+                self.stats["retries"] += 1
+                trace.trace_event("retry", pause, outcome=kind)
+                time.sleep(pause)
+            self.wait_turn()
+            start = time.time()
+            error = None
+            try:
+                result = attempt()
+            except Exception as e:
+                result, error = None, e
+            if result is EMPTY:
+                self.record(kind, time.time() - start, True)
+                self.stats["empty"] += 1
+                return result
+            self.record(kind, time.time() - start, bool(result))
+            if result:
+                if n:
+                    self.stats["recovered"] += 1
+                return result
+        if error is not None:
+            raise error
+        return result
+
+    def report(self):
+        st = self.stats
+        if not st["requests"]:
+            return
+        log.info(
+            "Pacing: %s requests, %s failed, %s empty, %s retries (%s recovered); %.1fs spent pacing,"
+            " max backoff %.1fs",
+            st["requests"], st["failures"], st["empty"], st["retries"], st["recovered"], st["paced"],
+            st["max_backoff"]
+        )
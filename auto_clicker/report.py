@@ -0,0 +1,78 @@
+"""
+Dry-run match report: which crawled listings each sheet row would apply to,
+and why every other card was left out, without opening any listing page.
+
+The report is JSON (one entry per row with its limits, ranked matches and
+rejections) or, for a path ending in .csv, one CSV line per (row, card).
+"""
+import csv
+import logging
+
+from .atomic import atomic_open, atomic_write_json
+from .listing_index import same_home_type
+
+log = logging.getLogger(__name__)
+
+CSV_FIELDS = ["row", "home_type", "status", "rank", "price", "living_area", "bedrooms",
+              "card_home_type", "href", "reason", "already_submitted"]
+
+def limit_failures(card, max_price, max_area, max_rooms):
+    """Return the list of limits card exceeds (empty if it matches)."""
+    reasons = []
+    if card["price"] > max_price:
+        reasons.append(f"price {card['price']} > {max_price}")
+    if card["living_area"] > max_area:
+        reasons.append(f"living area {card['living_area']} > {max_area}")
+    if card["bedrooms"] > max_rooms:
+        reasons.append(f"bedrooms {card['bedrooms']} > {max_rooms}")
+    return reasons
+
+def row_report(row_number, home_type, limits, index, unparsed=(), is_done=None, match_home_type=False):
+    """
+    Build the report entry of one sheet row. index is the row's ListingIndex,
+    unparsed the (card, reason) pairs the crawler could not index and is_done
+    an optional callable(listing_url) telling whether it was already submitted.
+    With match_home_type (an index of the unfiltered list) cards of another or
+    unknown home type are rejected too, as in ListingIndex.query().
+    Matches are ranked cheapest first, as the index is sorted by price.
+    """
+    max_price, max_area, max_rooms = limits
+    matches, rejected = [], []
+    for card in index.cards:
+        fields = {k: card[k] for k in ("price", "living_area", "bedrooms", "href")}
+        fields["card_home_type"] = card.get("home_type")
+        reasons = limit_failures(card, max_price, max_area, max_rooms)
+        if match_home_type and not same_home_type(card.get("home_type"), home_type):
+            reasons.append(f"home type {card.get('home_type') or 'unknown'} ≠ {home_type}")
+        if reasons:
+            rejected.append(dict(fields, reason="; ".join(reasons)))
+        else:
+            fields["rank"] = len(matches) + 1
+            fields["already_submitted"] = bool(is_done and is_done(card["href"]))
+            matches.append(fields)
+    for card, reason in unparsed:
+        rejected.append(dict({k: card.get(k) for k in ("price", "living_area", "bedrooms", "href")}, reason=reason))
+    return {
+        "row": row_number,
+        "home_type": home_type,
+        "limits": {"max_price": max_price, "max_area": max_area, "max_rooms": max_rooms},
+        "matches": matches,
+        "rejected": rejected,
+    }
+
+def write_report(path, entries):
+    if path.lower().endswith(".csv"):
+        with atomic_open(path, newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for entry in entries:
+                common = {"row": entry["row"], "home_type": entry["home_type"]}
+                for match in entry["matches"]:
+                    writer.writerow(dict(common, status="match", **match))
+                for rejected in entry["rejected"]:
+                    writer.writerow(dict(common, status="rejected", **rejected))
+    else:
+        atomic_write_json(path, entries, ensure_ascii=False, indent=1)
+    matches = sum(len(e["matches"]) for e in entries)
+    rejected = sum(len(e["rejected"]) for e in entries)
+    log.info("Dry-run report: %s rows, %s matches, %s rejections → %s", len(entries), matches, rejected, path)
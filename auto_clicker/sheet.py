@@ -0,0 +1,182 @@
+"""
+Sheet source: loads the applicant rows, normalises them and writes run results back.
+
+gspread is only imported when the Google Sheet is actually read.
+"""
+import json
+import logging
+import time
+
+from .atomic import atomic_write_json
+
+log = logging.getLogger(__name__)
+
+RESULT_COLUMNS = ["Run_Matched", "Run_Submitted", "Run_Failed", "Last_Run"]
+
+class SheetSource:
+    """
+    Loads the applicant rows and writes per-row run results back.
+
+    The Google Sheet is cached locally (config.sheet_cache_path) together with
+    its modification time; get_all_records() is only called again when the
+    spreadsheet's lastUpdateTime changes. Results are collected during the run
+    and written in one batched values update at the end.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.spreadsheet = None
+        self.cache = {}
+
+    def load(self):
+        config = self.config
+        if config.sheet_file:
+            # local JSON list of rows instead of Google Sheets (used by the offline benchmark)
+            with open(config.sheet_file, encoding="utf-8") as f:
+                return json.load(f)
+        import gspread
+
+        gc = gspread.service_account(filename=config.service_account)
+        cache = self._load_cache()
+        # Open Google Sheet by key when we know it (saves a Drive search), else by name
+        if cache.get("spreadsheet_id"):
+            sh = gc.open_by_key(cache["spreadsheet_id"])
+        else:
+            sh = gc.open(config.sheet_name)
+        self.spreadsheet = sh
+        modified = sh.get_lastUpdateTime()
+        if cache.get("modified") == modified and "rows" in cache:
+            log.info("Sheet unchanged since %s — using cached rows", modified)
+            self.cache = cache
+            return cache["rows"]
+
+        # Select the worksheet
+        worksheet = sh.worksheet(config.worksheet)
+        # Get all rows as list of dictionaries
+        data = worksheet.get_all_records()
+        self.cache = {
+            "spreadsheet_id": sh.id,
+            "sheet_name": config.sheet_name,
+            "worksheet": config.worksheet,
+            "modified": modified,
+            "headers": list(data[0].keys()) if data else [],
+            "rows": data,
+        }
+        self._save_cache()
+        return data
+
+    def write_results(self, results):
+        """
+        Write {sheet_row_number: {"matched", "submitted", "failed"}} to the
+        RESULT_COLUMNS of the sheet in one batched update (header cells for
+        missing columns are added in the same request).
+        """
+        if not results:
+            return
+        if self.spreadsheet is None:
+            log.warning("Sheet results not written (rows were not loaded from Google Sheets)")
+            return
+        from gspread.utils import rowcol_to_a1
+
+        headers = list(self.cache.get("headers") or [])
+        data = []
+        columns = {}
+        for name in RESULT_COLUMNS:
+            if name not in headers:
+                headers.append(name)
+                data.append((1, len(headers), name))
+            columns[name] = headers.index(name) + 1
+        stamp = time.strftime("%Y-%m-%d %H:%M")
+        for row_number, result in sorted(results.items()):
+            data.append((row_number, columns["Run_Matched"], result["matched"]))
+            data.append((row_number, columns["Run_Submitted"], result["submitted"]))
+            data.append((row_number, columns["Run_Failed"], result["failed"]))
+            data.append((row_number, columns["Last_Run"], stamp))
+
+        # Edited since we read it? Then the cached rows are stale after our write.
+        unchanged = bool(self.cache) and self.spreadsheet.get_lastUpdateTime() == self.cache.get("modified")
+        sheet = self.config.worksheet.replace("'", "''")
+        self.spreadsheet.values_batch_update({
+            "valueInputOption": "RAW",
+            "data": [
+                {"range": f"'{sheet}'!{rowcol_to_a1(r, c)}", "values": [[value]]}
+                for r, c, value in data
+            ],
+        })
+        log.info("Wrote results for %s rows back to the sheet (%s cells, 1 request)", len(results), len(data))
+
+        # Our own write bumps lastUpdateTime; keep the cache valid for the next
+        # run, unless someone else edited the sheet during this one.
+        if self.cache:
+            self.cache["headers"] = headers
+            if unchanged:
+                self.cache["modified"] = self.spreadsheet.get_lastUpdateTime()
+            else:
+                log.info("Sheet was edited during the run — the next run reads it again")
+                self.cache.pop("rows", None)
+                self.cache["modified"] = None
+            self._save_cache()
+
+    def _load_cache(self):
+        try:
+            with open(self.config.sheet_cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("sheet_name") != self.config.sheet_name or cache.get("worksheet") != self.config.worksheet:
+            return {}
+        return cache
+
+    def _save_cache(self):
+        atomic_write_json(self.config.sheet_cache_path, self.cache, ensure_ascii=False)
+
+def normalize_rows(sheet_data_raw):
+    """
+    Accept either a list of dicts or a single dict or list of strings and
+    return a list of rows. Raises ValueError for any other shape.
+    """
+    sheet_rows = []
+    if isinstance(sheet_data_raw, dict):
+        # if dict possibly contains list under a key
+        # try common shapes
+        if all(isinstance(v, list) for v in sheet_data_raw.values()):
+            # take first column-like list into rows
+            # fallback: convert into list of dict rows if keys match
+            try:
+                # if structure {'home_type': ['Appartement','Huis',...]}
+                if 'home_type' in sheet_data_raw and isinstance(sheet_data_raw['home_type'], list):
+                    sheet_rows = [{'home_type': s} for s in sheet_data_raw['home_type']]
+                else:
+                    # attempt to make rows by zipping lists
+                    keys = list(sheet_data_raw.keys())
+                    zipped = list(zip(*[sheet_data_raw[k] for k in keys]))
+                    for z in zipped:
+                        row = {k: v for k, v in zip(keys, z)}
+                        sheet_rows.append(row)
+            except Exception:
+                sheet_rows = [sheet_data_raw]
+        else:
+            # single-row dict
+            sheet_rows = [sheet_data_raw]
+    elif isinstance(sheet_data_raw, list):
+        sheet_rows = sheet_data_raw
+    else:
+        raise ValueError("Unsupported sheet data type; expected list or dict.")
+    return sheet_rows
+
+def row_home_type(row):
+    """Return the stripped Type_Of_Home of a sheet row (or None if empty)."""
+    if isinstance(row, dict):
+        home_type = row.get('Type_Of_Home') or str(list(row.values())[0])
+    else:
+        home_type = str(row)
+    if not home_type:
+        return None
+    return home_type.strip() or None
+
+def row_limits(row):
+    """Return (max_price, max_area, max_rooms) for a sheet row."""
+    max_price = int(row.get("max_rental_price", 2573))
+    max_area = int(row.get("max_living_area", 153))
+    max_rooms = int(row.get("max_bedrooms", 6))
+    return max_price, max_area, max_rooms
@@ -0,0 +1,48 @@
+"""
+Per-home-type snapshot of seen listings, used by the incremental crawl.
+
+The snapshot file maps a home-type key ("*" for the unfiltered list) to
+{listing_url: {"price", "living_area", "bedrooms", "home_type"}}.
+"""
+import json
+
+from .atomic import atomic_write_json
+
+SNAPSHOT_FIELDS = ("price", "living_area", "bedrooms", "home_type")
+
+def load_snapshot(path):
+    """Return the saved {home_type_key: {listing_url: fields}} snapshot, or {}."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_snapshot(path, snapshot):
+    atomic_write_json(path, snapshot, ensure_ascii=False, indent=1)
+
+def merge_snapshot(previous, cards, complete):
+    """
+    Compare freshly crawled cards against the previous snapshot of a home type.
+    Returns (snapshot, new, removed, changed) where snapshot is the updated
+    {listing_url: fields} mapping. Listings on pages that were not visited are
+    carried over unchanged; removals are only reported after a full sweep.
+    """
+    seen = {c["href"]: {k: c.get(k) for k in SNAPSHOT_FIELDS} for c in cards}
+    new = [url for url in seen if url not in previous]
+    changed = [
+        (url, previous[url], fields) for url, fields in seen.items()
+        if url in previous and {k: previous[url].get(k) for k in SNAPSHOT_FIELDS} != fields
+    ]
+    if complete:
+        removed = [url for url in previous if url not in seen]
+        snapshot = seen
+    else:
+        removed = []
+        snapshot = dict(previous)
+        snapshot.update(seen)
+    return snapshot, new, removed, changed
+
+def snapshot_cards(snapshot):
+    """Turn {listing_url: fields} back into card dicts for the ListingIndex."""
+    return [dict(fields, href=url, text="", price_source="snapshot") for url, fields in snapshot.items()]
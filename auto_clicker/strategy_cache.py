@@ -0,0 +1,66 @@
+"""
+Adaptive selector-strategy cache.
+
+Element lookups with several fallback strategies (Apply button, home-type
+checkbox) remember which strategy last succeeded and try it first, on later
+calls and later runs. Hit/miss counts are persisted as JSON; when the cached
+winner misses it is dropped and the default order is used again.
+"""
+import json
+import logging
+
+from .atomic import atomic_write_json
+
+log = logging.getLogger(__name__)
+
+class StrategyCache:
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def group(self, name):
+        return self.data.setdefault(name, {"winner": None, "stats": {}})
+
+    def order(self, group, names):
+        """Return names with the cached winner (if still known) moved to the front."""
+        winner = self.group(group)["winner"]
+        if winner in names:
+            return [winner] + [n for n in names if n != winner]
+        return list(names)
+
+    def hit(self, group, name):
+        g = self.group(group)
+        g["winner"] = name
+        g["stats"].setdefault(name, {"hits": 0, "misses": 0})["hits"] += 1
+
+    def miss(self, group, name):
+        g = self.group(group)
+        g["stats"].setdefault(name, {"hits": 0, "misses": 0})["misses"] += 1
+        if g["winner"] == name:
+            log.warning("Cached %s strategy '%s' failed — invalidating", group, name)
+            g["winner"] = None
+
+    def run(self, group, strategies):
+        """
+        Try strategies ({name: callable}) in cached order until one returns a
+        truthy value, record hits/misses and return that value (or None).
+        """
+        for name in self.order(group, list(strategies)):
+            try:
+                result = strategies[name]()
+            except Exception:
+                result = None
+            if result:
+                self.hit(group, name)
+                return result
+            self.miss(group, name)
+        return None
+
+    def save(self):
+        atomic_write_json(self.path, self.data, indent=1)
@@ -0,0 +1,304 @@
+"""
+Listing submitter: opens a listing, clicks 'Ik heb interesse' and sends the
+subscription form with a sheet row's applicant data.
+"""
+import logging
+import random
+from functools import partial
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException
+
+from . import trace
+from .listing_cache import ListingCache, OPEN, CLOSED, NO_FORM
+
+log = logging.getLogger(__name__)
+
+INTEREST_BTN_XPATH = "//p[contains(text(), 'Ik heb interesse')]"
+TOGGLE_IDS = ["tags.RegisteredInNetherlands", "tags.CreditCheckConsent", "consent"]
+
+# Sets all inputs through the native value setter (so Vue's v-model sees the
+# change), fires input/change, switches the q-toggles on and reports back.
+FILL_FORM_JS = """
+var fields = arguments[0], toggles = arguments[1];
+var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+var out = {fields: {}, toggles: {}};
+Object.keys(fields).forEach(function (id) {
+    var input = document.querySelector('div.input-field#' + CSS.escape(id) + ' input');
+    if (!input) { out.fields[id] = {found: false, ok: false, valid: false}; return; }
+    input.focus();
+    setter.call(input, fields[id]);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    input.blur();
+    out.fields[id] = {
+        found: true,
+        ok: input.value === String(fields[id]),
+        valid: input.checkValidity ? input.checkValidity() : true
+    };
+});
+toggles.forEach(function (id) {
+    var el = document.getElementById(id);
+    if (!el) { out.toggles[id] = false; return; }
+    var input = el.querySelector('.q-toggle__native');
+    if (input && !input.checked) {
+        input.checked = true;
+        input.dispatchEvent(new Event('change', {bubbles: true}));
+        var vue = el.__vue__;
+        if (vue && vue.toggle) vue.toggle();
+        var label = el.querySelector('.q-toggle__label');
+        if (label) label.click();
+    }
+    out.toggles[id] = !!(input && input.checked) || el.getAttribute('aria-checked') === 'true';
+});
+return out;
+"""
+
+# Input-field and toggle IDs of the visible subscription form, for the listing cache.
+FORM_META_JS = """
+var form = document.getElementById('subscription-form');
+if (!form) { return null; }
+var ids = function (selector) {
+    return Array.prototype.map.call(form.querySelectorAll(selector), function (el) { return el.id; });
+};
+return {fields: ids('div.input-field[id]'), toggles: ids('.q-toggle[id]')};
+"""
+
+_fake = None
+
+def get_faker():
+    """Return the shared Faker('nl_NL'), created on first use."""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+
+        _fake = Faker('nl_NL')
+    return _fake
+
+def generate_random_data():
+    fake = get_faker()
+    first_name = fake.first_name()
+    last_name = fake.last_name()
+    phone = "+316" + "".join([str(random.randint(0, 9)) for _ in range(8)])
+    email = f"{first_name}.{last_name}@yopmail.com".lower().replace(" ", "")
+    return {"name": first_name, "lastname": last_name, "email": email, "phone": phone}
+
+class Submitter:
+    """Submits listing forms through a Browser."""
+
+    def __init__(self, browser, config):
+        self.browser = browser
+        self.ready = browser.ready
+        self.listing_cache = ListingCache(config.listing_cache_path, config.listing_cache_ttl * 60,
+                                          config.listing_cache_size)
+
+    @property
+    def driver(self):
+        return self.browser.driver
+
+    def submit_listing(self, listing_url, row):
+        """
+        Open a listing, click 'Ik heb interesse', fill the subscription form with
+        the row's applicant data and submit it.
+        Listings the cache knows to be closed or formless are skipped unopened.
+        Returns "thank_you", "no_redirect", "failed" or "skipped".
+        """
+        driver, wait_for = self.driver, self.browser.wait_for
+        meta = self.listing_cache.get(listing_url)
+        reason = self.listing_cache.skip_reason(meta)
+        if reason:
+            log.info("Skipping %s: %s (listing cache)", listing_url, reason)
+            return "skipped"
+
+        # -----------------------------
+        # REPLACEMENT: USE SHEET DATA
+        # -----------------------------
+        sheet_first = row.get("First_Name", "")
+        sheet_last = row.get("Last_Name", "")
+        sheet_email = row.get("Email", "")
+        sheet_phone = row.get("Phone", "")
+        values, toggles = self.prepare_form({
+            "name": str(sheet_first),
+            "lastname": str(sheet_last),
+            "email": str(sheet_email),
+            "phone": str(sheet_phone),
+        }, meta)
+
+        log.info("Processing listing: %s", listing_url)
+        with trace.span("listing_open") as s:
+            try:
+                self.browser.pacer.run("listing", partial(self.open_listing, listing_url))
+            except Exception:
+                log.warning("Failed to open listing, skipping.")
+                s["outcome"] = "failed"
+                return "skipped"
+
+        # Step 1: Click interest button
+        try:
+            btn = wait_for("interest_button", EC.element_to_be_clickable((By.XPATH, INTEREST_BTN_XPATH)))
+            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
+            try:
+                btn.click()
+            except ElementClickInterceptedException:
+                driver.execute_script("arguments[0].click();", btn)
+            log.info("Clicked 'Ik heb interesse!'")
+        except TimeoutException:
+            log.warning("Couldn't find 'Ik heb interesse!' button, skipping.")
+            if self.confirmed_absent(By.XPATH, INTEREST_BTN_XPATH):
+                self.remember(listing_url, CLOSED)
+            return "skipped"
+
+        # Step 2: Wait for form
+        try:
+            form = wait_for("form", EC.visibility_of_element_located((By.ID, "subscription-form")))
+            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", form)
+            self.ready.settle(1)
+        except TimeoutException:
+            log.warning("Form did not appear, skipping.")
+            if self.confirmed_absent(By.ID, "subscription-form"):
+                self.remember(listing_url, NO_FORM)
+            return "skipped"
+        if meta is None:
+            self.remember_form(listing_url)
+
+        # Step 3: Fill form using sheet data (inputs and toggles in one call)
+        with trace.span("form_fill") as s:
+            summary = self.fill_form(values, toggles)
+            s["typed"] = summary["typed"]
+            s["invalid"] = summary["invalid"]
+            log.info("Filled form with SHEET data: %s %s (%s)", sheet_first, sheet_last, sheet_email)
+            self.ready.settle(1)
+
+        # === Click "Verzenden" Button ===
+        outcome = "failed"
+        try:
+            with trace.span("submit"):
+                submit_btn = wait_for("submit_button", EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Verzenden')]")))
+                driver.execute_script("arguments[0].scrollIntoView(true);", submit_btn)
+                driver.execute_script("arguments[0].click();", submit_btn)
+                log.info("SUBMITTED: Verzenden button clicked via JS")
+
+            with trace.span("thank_you_wait") as s:
+                try:
+                    wait_for("thank_you", EC.url_contains("/thank-you/"))
+                    log.info("SUCCESS: Thank you page loaded!")
+                    outcome = "thank_you"
+                except Exception:
+                    log.info("No redirect, but form likely sent")
+                    outcome = "no_redirect"
+                s["outcome"] = outcome
+        except Exception as e:
+            log.error("Submit failed: %s", e)
+
+        self.ready.settle(3)
+        return outcome
+
+    def open_listing(self, listing_url):
+        self.driver.get(listing_url)
+        self.browser.wait_for("listing_open", EC.url_to_be(listing_url))
+        return True
+
+    def prepare_form(self, values, meta):
+        """
+        Return (values, toggle IDs) for fill_form(). With cached metadata of an
+        open listing, fields and TOGGLE_IDS consents its form lacks are left
+        out, so they are not waited for and typed one by one. Other toggles on
+        the form (newsletter, marketing) are never switched on.
+        """
+        if not meta or not meta["fields"]:
+            return values, TOGGLE_IDS
+        missing = [f for f in values if f not in meta["fields"]]
+        if missing:
+            log.warning("Cached form has no %s field — leaving it out", ", ".join(missing))
+        toggles = [t for t in TOGGLE_IDS if t in meta["toggles"]] or TOGGLE_IDS
+        return {f: v for f, v in values.items() if f in meta["fields"]}, toggles
+
+    def confirmed_absent(self, by, selector):
+        """
+        True only if the page has settled and shows no such element. A wait
+        that ran out is no proof: the page may just be slow, and caching it as
+        closed would skip the listing for the whole TTL.
+        """
+        if not self.ready.settle(2):
+            log.debug("Page did not settle — not caching %s as absent", selector)
+            return False
+        try:
+            return not any(el.is_displayed() for el in self.driver.find_elements(by, selector))
+        except Exception:
+            return False
+
+    def remember(self, listing_url, status, fields=(), toggles=()):
+        """Cache what the listing page showed, unless a deadline cut the wait short."""
+        if self.browser.timeouts.expired():
+            return
+        self.listing_cache.put(listing_url, status, fields, toggles)
+
+    def remember_form(self, listing_url):
+        try:
+            form = self.driver.execute_script(FORM_META_JS)
+        except Exception as e:
+            log.debug("Form metadata script failed: %s", e)
+            form = None
+        if form:
+            self.remember(listing_url, OPEN, form["fields"], form["toggles"])
+
+    def fill_form(self, values, toggles=TOGGLE_IDS):
+        """
+        Fill every input and switch on every toggle with one execute_script
+        call, firing the input/change events the Vue components listen to.
+        Fields that reject the programmatic value are typed instead, and
+        toggles that stayed off are retried with activate_toggle().
+        Returns {"fields", "toggles", "typed", "invalid"}.
+        """
+        try:
+            summary = self.driver.execute_script(FILL_FORM_JS, values, toggles)
+        except Exception as e:
+            log.warning("Form script failed (%s) — typing every field", e)
+            summary = {"fields": {f: {"found": False, "ok": False, "valid": False} for f in values},
+                       "toggles": {t: False for t in toggles}}
+        summary["typed"] = []
+        for field_id, status in summary["fields"].items():
+            if status["ok"]:
+                continue
+            log.warning("Field '%s' rejected programmatic input — typing it", field_id)
+            try:
+                self.fill_input(field_id, values[field_id])
+                summary["typed"].append(field_id)
+            except Exception as e:
+                log.warning("Field '%s' error: %s", field_id, e)
+        for tid, on in summary["toggles"].items():
+            if on:
+                log.debug("Toggle ON: %s", tid)
+                continue
+            try:
+                self.activate_toggle(tid)
+            except Exception as e:
+                log.warning("Toggle %s error: %s", tid, e)
+        summary["invalid"] = [f for f, status in summary["fields"].items() if status["found"] and not status["valid"]]
+        if summary["invalid"]:
+            log.warning("⚠ Form reports invalid fields: %s", ", ".join(summary["invalid"]))
+        return summary
+
+    def fill_input(self, field_id, value):
+        input_el = self.browser.wait_for("form_input", EC.element_to_be_clickable((By.CSS_SELECTOR, f"div.input-field#{field_id} input")))
+        input_el.clear()
+        input_el.send_keys(value)
+
+    def activate_toggle(self, toggle_id):
+        js = f"""
+        const el = document.getElementById('{toggle_id}');
+        if (el) {{
+            const input = el.querySelector('.q-toggle__native');
+            const label = el.querySelector('.q-toggle__label');
+            if (input && !input.checked) {{
+                input.checked = true;
+                input.dispatchEvent(new Event('change', {{bubbles: true}}));
+                const vue = el.__vue__;
+                if (vue && vue.toggle) vue.toggle();
+                if (label) label.click();
+            }}
+        }}
+        """
+        self.driver.execute_script(js)
+        log.debug("Toggle ON: %s", toggle_id)
@@ -0,0 +1,92 @@
+"""
+Per-step wait budgets and per-unit deadlines, replacing the single 30-second
+WebDriverWait.
+
+Optional elements (the cookie banner, fallback selectors) get short budgets,
+page loads longer ones. A deadline bounds a whole unit of work, one listing or
+one home type: no wait inside it runs past it. Waits that run out are counted
+per step, written to the trace as "timeout" spans and summarised at the end.
+
+    with browser.timeouts.deadline("listing", config.listing_deadline):
+        browser.wait_for("interest_button", EC.element_to_be_clickable(...))
+"""
+import logging
+import time
+from contextlib import contextmanager
+
+from . import trace
+
+log = logging.getLogger(__name__)
+
+STEP_BUDGETS = {  # seconds, before config.timeout_scale
+    "cookie_banner": 3,
+    "apply_button": 5,  # the first (cached) Apply strategy
+    "checkbox": 5,  # the first (cached) checkbox strategy
+    "fallback": 2,  # every further fallback selector
+    "results": 20,  # offer cards after applying a filter or loading a page
+    "paginator": 3,  # the 'Volgende' button, which may render just after the cards
+    "listing_open": 20,
+    "interest_button": 10,
+    "form": 10,
+    "form_input": 5,
+    "submit_button": 5,
+    "thank_you": 15,
+}
+DEFAULT_BUDGET = 10
+
+class Deadline:
+
+    def __init__(self, name, seconds):
+        self.name = name
+        self.seconds = seconds
+        self.expires = time.time() + seconds
+
+    def remaining(self):
+        return self.expires - time.time()
+
+class TimeoutPolicy:
+    """Budgets for browser.wait_for() plus the timeout statistics of a run."""
+
+    def __init__(self, config):
+        self.scale = config.timeout_scale
+        self.deadlines = []  # innermost last
+        self.reset()
+
+    def reset(self):
+        self.hits = {}  # step -> count
+        self.expired_deadlines = {}  # deadline name -> count
+
+    def budget(self, step):
+        """Seconds a wait for step may take: its budget, capped by open deadlines."""
+        seconds = STEP_BUDGETS.get(step, DEFAULT_BUDGET) * self.scale
+        for d in self.deadlines:
+            seconds = min(seconds, d.remaining())
+        return max(0.0, seconds)
+
+    @contextmanager
+    def deadline(self, name, seconds):
+        d = Deadline(name, seconds)
+        self.deadlines.append(d)
+        try:
+            yield d
+        finally:
+            self.deadlines.remove(d)
+            if d.remaining() <= 0:
+                log.warning("%s deadline of %.0fs exceeded", name, seconds)
+                self.expired_deadlines[name] = self.expired_deadlines.get(name, 0) + 1
+
+    def expired(self):
+        """The first open deadline that has run out, or None."""
+        return next((d for d in self.deadlines if d.remaining() <= 0), None)
+
+    def hit(self, step, waited):
+        self.hits[step] = self.hits.get(step, 0) + 1
+        d = self.expired()
+        trace.trace_event("timeout", waited, outcome=step, deadline=d.name if d else None)
+
+    def report(self):
+        total = sum(self.hits.values())
+        by_step = ", ".join(f"{k} {v}" for k, v in sorted(self.hits.items())) or "none"
+        deadlines = ", ".join(f"{k} {v}" for k, v in sorted(self.expired_deadlines.items()))
+        log.info("Timeouts: %s waits ran out (%s)%s", total, by_step,
+                 "; deadlines exceeded: " + deadlines if deadlines else "")
@@ -0,0 +1,84 @@
+"""
+Run trace: per-stage spans written as JSONL and summarised at the end of a run.
+
+    with trace.span("apply_button") as s:
+        s["strategy"] = click_apply_button()
+"""
+import json
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()  # spans may be recorded from worker threads (sheet load)
+_trace_file = None
+_trace_path = "run_trace.jsonl"
+stage_durations = {}   # stage -> [seconds, ...]
+path_counts = {}       # (stage, strategy/outcome) -> count
+
+def configure(path):
+    """Start a new trace written to path (appends) and reset the summary."""
+    global _trace_path
+    close()
+    _trace_path = path
+    stage_durations.clear()
+    path_counts.clear()
+
+def trace_event(stage, duration, **attrs):
+    """Append one span to the trace file and keep it for the end-of-run summary."""
+    global _trace_file
+    event = {"stage": stage, "ts": time.time(), "duration": round(duration, 4)}
+    event.update(attrs)
+    line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+    path = attrs.get("strategy") or attrs.get("outcome")
+    with _lock:
+        if _trace_file is None:
+            _trace_file = open(_trace_path, "a", encoding="utf-8", buffering=1)
+        _trace_file.write(line)
+        stage_durations.setdefault(stage, []).append(duration)
+        if path:
+            path_counts[(stage, path)] = path_counts.get((stage, path), 0) + 1
+
+@contextmanager
+def span(stage, **attrs):
+    """
+    Time the enclosed block as one stage. The yielded dict can be filled with
+    extra fields such as "strategy" or "outcome"; exceptions are recorded
+    as outcome "error" and re-raised.
+    """
+    record = dict(attrs)
+    start = time.time()
+    try:
+        yield record
+    except Exception as e:
+        record.setdefault("outcome", "error")
+        record["error"] = str(e)
+        raise
+    finally:
+        trace_event(stage, time.time() - start, **record)
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def report():
+    log.info("Stage latency (count / p50 / p95 / total, seconds):")
+    for stage, values in stage_durations.items():
+        log.info("  %-16s %5s  %7.2f  %7.2f  %8.1f",
+                 stage, len(values), percentile(values, 50), percentile(values, 95), sum(values))
+    if path_counts:
+        log.info("Paths taken:")
+        for (stage, path), count in sorted(path_counts.items()):
+            log.info("  %s: %s x%s", stage, path, count)
+    close()
+
+def close():
+    global _trace_file
+    if _trace_file is not None:
+        _trace_file.close()
+        _trace_file = None
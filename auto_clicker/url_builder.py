@@ -0,0 +1,98 @@
+"""
+Direct URLs for filtered and paged result pages.
+
+The site keeps its filter state in the URL (?filter=stage:available...). After
+the first home type has been selected through the UI, the resulting URL is
+turned into a template; after the first 'Volgende' click, the page parameter
+is learned the same way. The crawler verifies each template once per session
+against the UI result before using it, and falls back to clicking otherwise.
+"""
+import re
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, quote, quote_plus
+
+MARKER = "__HOME_TYPE__"
+# a home type in the query is a whole filter value: "type:Studio", "type=Studio", "type:A,Studio;..."
+# (also with the separators percent-encoded)
+TOKEN_BEFORE = r"(?:(?<=[:,;=])|(?<=(?i:%3A))|(?<=(?i:%2C))|(?<=(?i:%3B))|(?<=(?i:%3D)))"
+TOKEN_AFTER = r"(?=[:,;&]|(?i:%3A|%2C|%3B)|$)"
+
+ENCODERS = {
+    "raw": lambda s: s,
+    "quote": lambda s: quote(s, safe=""),
+    "quote_plus": quote_plus,
+    "lower": lambda s: quote(s.lower(), safe=""),
+    "slug": lambda s: quote(s.lower().replace(" ", "-"), safe=""),
+}
+
+def _set_param(url, name, value):
+    parts = urlparse(url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+    if value is None:
+        query.pop(name, None)
+    else:
+        query[name] = [str(value)]
+    return urlunparse(parts._replace(query=urlencode(query, doseq=True, safe=":,;")))
+
+class FilterUrlBuilder:
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.template = None
+        self.encoder = None
+        self.page_param = None
+        self.filter_verified = False
+        self.page_verified = False
+        self.failed = False  # a template did not reproduce the UI result; stop trying
+
+    def learn_filter(self, home_type, url):
+        """
+        Derive the filter template from the URL the UI produced for home_type.
+        Only whole filter values in the query string are replaced: the path
+        ("woning" in /huur/woningen) or a key ("woningtype:woning") may
+        contain the home type too.
+        """
+        if self.failed or self.template or not url or url == self.base_url:
+            return False
+        parts = urlparse(url)
+        for name, encode in ENCODERS.items():
+            token = encode(home_type)
+            if not token:
+                continue
+            query, found = re.subn(TOKEN_BEFORE + re.escape(token) + TOKEN_AFTER, MARKER, parts.query, count=1)
+            if found:
+                template = urlunparse(parts._replace(query=query))
+                if self.page_param:
+                    template = _set_param(template, self.page_param, None)
+                self.template, self.encoder = template, name
+                return True
+        return False
+
+    def learn_page(self, url_before, url_after, page):
+        """Find the query parameter that changed to page between two URLs."""
+        if self.failed or self.page_param:
+            return False
+        before = parse_qs(urlparse(url_before).query)
+        after = parse_qs(urlparse(url_after).query)
+        for name, values in after.items():
+            if values == [str(page)] and before.get(name) != values:
+                self.page_param = name
+                if self.template:
+                    self.template = _set_param(self.template, name, None)
+                return True
+        return False
+
+    def can_filter(self, home_type):
+        return home_type is None or (self.template is not None and not self.failed)
+
+    def can_page(self):
+        return self.page_param is not None and not self.failed
+
+    def build(self, home_type, page=1):
+        """Return the results URL for home_type (None = unfiltered) and page."""
+        if home_type is None:
+            url = self.base_url
+        else:
+            url = self.template.replace(MARKER, ENCODERS[self.encoder](home_type))
+        if page > 1:
+            url = _set_param(url, self.page_param, page)
+        return url
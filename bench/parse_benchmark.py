@@ -0,0 +1,127 @@
+"""
+Card-parser micro-benchmark: accuracy on the fixture corpus and parse
+throughput, without a browser.
+
+    python bench/parse_benchmark.py --cards 50000
+
+Accuracy compares every field of auto_clicker.card_parser.parse() with the
+expected values in bench/fixtures/cards.jsonl. Throughput parses --cards
+cards whose text is laid out like the site's cards (generated with the
+stand-in site's listing generator, plus the fixtures) and reports cards per
+second. --legacy also times the old inline parsing for comparison.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.dirname(HERE))
+import standin_site  # noqa: E402
+from auto_clicker import card_parser  # noqa: E402
+
+FIXTURES = os.path.join(HERE, "fixtures", "cards.jsonl")
+FIELDS = ("price", "living_area", "bedrooms")
+
+def load_fixtures(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def generated_cards(count, seed=1):
+    """Card texts in the site's layout, from the stand-in listing generator."""
+    per_type = max(1, count // len(standin_site.HOME_TYPES))
+    cards = []
+    for listing in standin_site.generate_listings(1, per_type, seed=seed)[:count]:
+        price = standin_site.format_price(listing["price"])
+        text = (f"{listing['street']}\n{listing['postcode']} {listing['city']}\n{price}\n"
+                f"{listing['area']} m² {listing['bedrooms']}")
+        cards.append({"text": text, "price_text": price, "href": f"/huur/woningen/{listing['id']}"})
+    return cards
+
+def legacy_parse(text, price_text):
+    """The parsing that used to be inline in the pagination loop (for comparison)."""
+    price = None
+    if price_text:
+        try:
+            price = int(price_text.replace("€", "").replace("p/m", "").replace(".", "").replace(",", "").strip())
+        except ValueError:
+            price = None
+    if price is None:
+        match = re.search(r"€\s*([\d\.\,]+)\s*p/m", text)
+        if match:
+            price = int(match.group(1).replace(".", "").replace(",", ""))
+    area_match = re.search(r"(\d+)\s*m²", text)
+    living_area = int(area_match.group(1)) if area_match else None
+    bedrooms = 1
+    for n in re.findall(r"\b(\d+)\b", text):
+        if int(n) != living_area:
+            bedrooms = int(n)
+    return {"price": price, "living_area": living_area, "bedrooms": bedrooms}
+
+def accuracy(fixtures, parse):
+    """Return (correct fields, total fields, [(note, field, got, expected)])."""
+    correct, misses = 0, []
+    for case in fixtures:
+        got = parse(case)
+        for field in FIELDS:
+            if got[field] == case["expected"][field]:
+                correct += 1
+            else:
+                misses.append((case["note"], field, got[field], case["expected"][field]))
+    return correct, len(fixtures) * len(FIELDS), misses
+
+def throughput(cards, parse, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for card in cards:
+            parse(card)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(cards) / best
+
+def parse_new(card):
+    record = card_parser.parse(card["text"], card.get("price_text"), card.get("href"))
+    return {field: getattr(record, field) for field in FIELDS}
+
+def parse_legacy(card):
+    return legacy_parse(card["text"] or "", card.get("price_text"))
+
+def main():
+    parser = argparse.ArgumentParser(description="Card parser accuracy and throughput")
+    parser.add_argument("--fixtures", default=FIXTURES, help="JSONL corpus with expected fields")
+    parser.add_argument("--cards", type=int, default=20000, help="cards to parse for throughput")
+    parser.add_argument("--repeat", type=int, default=3, help="throughput runs (best is reported)")
+    parser.add_argument("--legacy", action="store_true", help="also measure the old inline parser")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    cards = generated_cards(args.cards) + fixtures
+    parsers = {"card_parser": parse_new}
+    if args.legacy:
+        parsers["legacy"] = parse_legacy
+
+    results = {}
+    for name, parse in parsers.items():
+        correct, total, misses = accuracy(fixtures, parse)
+        results[name] = {
+            "accuracy": correct / total,
+            "misses": misses,
+            "cards_per_second": throughput(cards, parse, args.repeat),
+        }
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=1))
+        return
+    print(f"{len(fixtures)} fixtures, {len(cards)} cards for throughput")
+    for name, r in results.items():
+        print(f"{name:<12} accuracy {r['accuracy']:6.1%}   {r['cards_per_second']:>10,.0f} cards/s")
+        for note, field, got, expected in r["misses"]:
+            print(f"    ✘ {note}: {field} = {got!r}, expected {expected!r}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Offline benchmark: drives main.py against the local stand-in site.
+
+Each run starts the stand-in (bench/standin_site.py) on a free port, writes a
+sheet with one row per home type, runs main.py in headless Chrome inside a
+fresh temporary directory (so ledger and snapshot files start empty) and reads
+the stage spans from its run_trace.jsonl.
+
+    python bench/run_benchmark.py --pages 5 --latency 0.1 --repeat 3
+
+Reports listings per minute, time per results page and time per submission.
+Needs Chrome; chromedriver is resolved by Selenium.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import standin_site  # noqa: E402
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+CRAWL_STAGES = ("cookie_accept", "checkbox", "apply_button", "card_extraction", "page_fetch")
+
+def sheet_rows(max_price, count):
+    rows = []
+    for n, home_type in enumerate(standin_site.HOME_TYPES[:count], start=1):
+        rows.append({
+            "Type_Of_Home": home_type,
+            "max_rental_price": max_price,
+            "max_living_area": 200,
+            "max_bedrooms": 6,
+            "First_Name": "Bench",
+            "Last_Name": f"Row{n}",
+            "Email": f"bench.row{n}@example.com",
+            "Phone": "+31600000000",
+        })
+    return rows
+
+def load_trace(path):
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                events.append(json.loads(line))
+    return events
+
+def summarize(events):
+    """Turn the trace spans of one run into the benchmark metrics."""
+    def start(e):
+        return e["ts"] - e["duration"]
+
+    crawl = [e for e in events if e["stage"] in CRAWL_STAGES]
+    extractions = [e for e in events if e["stage"] == "card_extraction"]
+    opens = [e for e in events if e["stage"] == "listing_open"]
+    done = [e for e in events if e["stage"] == "thank_you_wait"]
+
+    metrics = {"pages": len(extractions), "cards": sum(e.get("cards", 0) for e in extractions),
+               "submissions": len(done)}
+    if crawl and extractions:
+        crawl_time = max(e["ts"] for e in extractions) - min(start(e) for e in crawl)
+        metrics["crawl_seconds"] = crawl_time
+        metrics["listings_per_minute"] = metrics["cards"] / crawl_time * 60 if crawl_time else 0.0
+        metrics["seconds_per_page"] = crawl_time / len(extractions)
+    if opens and done:
+        submit_time = max(e["ts"] for e in done) - min(start(e) for e in opens)
+        metrics["seconds_per_submission"] = submit_time / len(opens)
+    return metrics
+
+def run_once(args):
+    server = standin_site.start_in_thread(
+        pages=args.pages, per_page=args.per_page, latency=args.latency, jitter=args.jitter, seed=args.seed,
+    )
+    try:
+        with tempfile.TemporaryDirectory(prefix="acb-bench-") as workdir:
+            sheet = os.path.join(workdir, "sheet.json")
+            with open(sheet, "w", encoding="utf-8") as f:
+                json.dump(sheet_rows(args.max_price, args.rows), f)
+            env = dict(os.environ,
+                       AUTO_CLICK_BASE_URL=standin_site.base_url(server),
+                       AUTO_CLICK_SHEET_FILE=sheet,
+                       AUTO_CLICK_HEADLESS="1",
+                       AUTO_CLICK_LEAN="1" if args.lean else "0")
+            started = time.time()
+            result = subprocess.run(
+                [sys.executable, MAIN], cwd=workdir, env=env, timeout=args.timeout,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+            )
+            wall = time.time() - started
+            if result.returncode != 0:
+                print(result.stdout[-4000:])
+                raise SystemExit(f"main.py exited with {result.returncode}")
+            metrics = summarize(load_trace(os.path.join(workdir, "run_trace.jsonl")))
+            metrics["wall_seconds"] = wall
+            metrics["server_submissions"] = server.RequestHandlerClass.submissions
+            return metrics
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark main.py against the local stand-in site")
+    parser.add_argument("--pages", type=int, default=3, help="result pages per home type")
+    parser.add_argument("--per-page", type=int, default=12)
+    parser.add_argument("--rows", type=int, default=len(standin_site.HOME_TYPES), help="sheet rows (one per home type)")
+    parser.add_argument("--max-price", type=int, default=900, help="max_rental_price for every row (controls submissions)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds injected into every request")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--lean", action="store_true", help="run the bot in lean browser mode")
+    parser.add_argument("--timeout", type=float, default=900, help="per-run timeout, seconds")
+    parser.add_argument("--json", help="also write the per-run metrics to this file")
+    args = parser.parse_args()
+
+    runs = []
+    for n in range(1, args.repeat + 1):
+        metrics = run_once(args)
+        runs.append(metrics)
+        print(f"run {n}: " + ", ".join(
+            f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in metrics.items()))
+
+    print(f"\n{args.pages} pages x {args.per_page} cards per home type, {args.rows} rows, "
+          f"latency {args.latency}s (+{args.jitter}s jitter), {len(runs)} run(s)")
+    for key in ("listings_per_minute", "seconds_per_page", "seconds_per_submission", "wall_seconds"):
+        values = [r[key] for r in runs if key in r]
+        if values:
+            print(f"  {key:<24} median {statistics.median(values):8.2f}  min {min(values):8.2f}  max {max(values):8.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "runs": runs}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
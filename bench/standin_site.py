@@ -0,0 +1,284 @@
+"""
+Local stand-in for the listings site, used by the offline benchmark.
+
+Serves pages shaped like the real ones: q-checkbox home-type filters with an
+Apply button, div.property.offer-card cards with price/m²/bedroom text,
+'Volgende' pagination (client-side, fed by a JSON endpoint like the real Nuxt
+app), listing pages with 'Ik heb interesse', #subscription-form with its
+q-toggle toggles, and a /thank-you/ redirect after submitting.
+
+Run it on its own with:
+    python bench/standin_site.py --port 8000 --pages 5 --latency 0.1
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+HOME_TYPES = ["Appartement", "Eengezinswoning", "Studio"]
+STREETS = ["Kerkstraat", "Molenweg", "Dorpsstraat", "Stationsplein", "Parklaan", "Havenkade"]
+CITIES = ["Utrecht", "Amersfoort", "Zwolle", "Deventer", "Arnhem"]
+
+def generate_listings(pages, per_page, seed=1):
+    """Return pages * per_page listings for every home type (deterministic for a seed)."""
+    rng = random.Random(seed)
+    listings = []
+    for home_type in HOME_TYPES:
+        for _ in range(pages * per_page):
+            listing_id = len(listings) + 1
+            listings.append({
+                "id": listing_id,
+                "type": home_type,
+                "street": f"{rng.choice(STREETS)} {rng.randint(1, 250)}",
+                "postcode": f"{rng.randint(1000, 9999)} {rng.choice('ABCDEFGHJKLMNPRSTVWXZ')}{rng.choice('ABCDEFGHJKLMNPRSTVWXZ')}",
+                "city": rng.choice(CITIES),
+                "price": rng.randrange(700, 2500, 5),
+                "area": rng.randint(25, 180),
+                "bedrooms": rng.randint(1, 5),
+            })
+    return listings
+
+def format_price(price):
+    return f"€ {price:,}".replace(",", ".") + " p/m"
+
+LIST_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Huurwoningen</title></head>
+<body>
+<div id="__nuxt"><div><div><div>
+<div id="cookiescript_injected" style="position:fixed;bottom:0;left:0;right:0;background:#eee;padding:8px">
+  Wij gebruiken cookies. <button id="cookiescript_accept">Alles accepteren</button>
+</div>
+<section></section>
+<section>
+  <article><div><div><div>
+    <div>
+      <form onsubmit="return false">
+        <div class="form">__CHECKBOXES__</div>
+        <div></div>
+        <div><button type="button" class="btn" id="apply">Filter toepassen</button></div>
+      </form>
+    </div>
+  </div></div></div></article>
+  <div id="results"></div>
+  <div class="pagination">
+    <button type="button" id="prev"><span>Vorige</span></button>
+    <button type="button" id="next"><span>Volgende</span></button>
+  </div>
+</section>
+</div></div></div></div>
+<script>
+var state = {page: 1, pages: 1, types: []};
+// Like the real site, filter and page live in the URL: ?filter=stage:available;type:A,B&page=2
+(function () {
+  var params = new URLSearchParams(location.search);
+  var m = /type:([^;]*)/.exec(params.get('filter') || '');
+  if (m) { state.types = m[1].split(',').filter(Boolean); }
+  state.page = parseInt(params.get('page') || '1', 10);
+  Array.prototype.forEach.call(document.querySelectorAll('div.q-checkbox'), function (cb) {
+    if (state.types.indexOf(cb.textContent.trim()) !== -1) { cb.setAttribute('aria-checked', 'true'); }
+  });
+})();
+function syncUrl() {
+  var filter = 'stage:available' + (state.types.length ? ';type:' + state.types.join(',') : '');
+  history.replaceState(null, '', location.pathname + '?filter=' + filter + (state.page > 1 ? '&page=' + state.page : ''));
+}
+if (document.cookie.indexOf('CookieScriptConsent') !== -1) {
+  document.getElementById('cookiescript_injected').style.display = 'none';
+}
+document.getElementById('cookiescript_accept').onclick = function () {
+  document.cookie = 'CookieScriptConsent=accepted; path=/';
+  document.getElementById('cookiescript_injected').style.display = 'none';
+};
+Array.prototype.forEach.call(document.querySelectorAll('div.q-checkbox'), function (cb) {
+  cb.onclick = function () {
+    var on = cb.getAttribute('aria-checked') !== 'true';
+    cb.setAttribute('aria-checked', on ? 'true' : 'false');
+    cb.classList.toggle('q-checkbox--checked', on);
+  };
+});
+function card(l) {
+  return '<div class="property offer-card"><a class="offer-card__content" href="/huur/woningen/' + l.id + '">' +
+    '<div class="offer-card__title">' + l.street + '</div><div>' + l.postcode + ' ' + l.city + '</div>' +
+    '<div><b>' + l.price_text + '</b></div>' +
+    '<div><span class="property__details--item">' + l.area + ' m²</span> ' +
+    '<span class="property__details--item">' + l.bedrooms + '</span></div></a></div>';
+}
+function load() {
+  var url = '/api/offers?page=' + state.page + '&types=' + encodeURIComponent(state.types.join(','));
+  fetch(url).then(function (r) { return r.json(); }).then(function (data) {
+    state.pages = data.pages;
+    syncUrl();
+    document.getElementById('results').innerHTML = data.items.map(card).join('');
+    var next = document.getElementById('next');
+    if (state.page >= state.pages) { next.setAttribute('disabled', 'disabled'); next.className = 'disabled'; }
+    else { next.removeAttribute('disabled'); next.className = ''; }
+  });
+}
+document.getElementById('apply').onclick = function () {
+  state.types = Array.prototype.map.call(
+    document.querySelectorAll('div.q-checkbox[aria-checked="true"] .q-checkbox__label'),
+    function (l) { return l.textContent.trim(); });
+  state.page = 1;
+  load();
+};
+document.getElementById('next').onclick = function () {
+  if (state.page < state.pages) { state.page++; load(); }
+};
+document.getElementById('prev').onclick = function () {
+  if (state.page > 1) { state.page--; load(); }
+};
+load();
+</script>
+</body></html>
+"""
+
+CHECKBOX = ('<div class="q-checkbox" role="checkbox" aria-checked="false"><div class="q-checkbox__inner"></div>'
+            '<div class="q-checkbox__label">{label}</div></div>')
+
+DETAIL_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>__TITLE__</title></head>
+<body>
+<div id="__nuxt">
+  <h1>__TITLE__</h1>
+  <p>__PRICE__ · __AREA__ m² · __BEDROOMS__ slaapkamers</p>
+  <div class="interest"><p id="interest">Ik heb interesse!</p></div>
+  <form id="subscription-form" style="display:none" onsubmit="return false">
+    <div class="input-field" id="name"><input type="text"></div>
+    <div class="input-field" id="lastname"><input type="text"></div>
+    <div class="input-field" id="email"><input type="email"></div>
+    <div class="input-field" id="phone"><input type="tel"></div>
+    __TOGGLES__
+    <button type="button" id="submit">Verzenden</button>
+  </form>
+</div>
+<script>
+document.getElementById('interest').onclick = function () {
+  setTimeout(function () { document.getElementById('subscription-form').style.display = 'block'; }, 50);
+};
+document.getElementById('submit').onclick = function () {
+  var values = Array.prototype.map.call(document.querySelectorAll('#subscription-form .input-field input'),
+    function (i) { return i.value; });
+  var toggles = Array.prototype.every.call(document.querySelectorAll('.q-toggle__native'),
+    function (t) { return t.checked; });
+  if (values.some(function (v) { return !v; }) || !toggles) { return; }
+  fetch('/api/subscribe', {method: 'POST', body: JSON.stringify({listing: __ID__, fields: values})})
+    .then(function () { window.location.href = '/thank-you/'; });
+};
+</script>
+</body></html>
+"""
+
+TOGGLE = ('<div class="q-toggle" id="{id}"><input class="q-toggle__native" type="checkbox">'
+          '<div class="q-toggle__label">{id}</div></div>')
+TOGGLE_IDS = ["tags.RegisteredInNetherlands", "tags.CreditCheckConsent", "consent"]
+
+class StandinHandler(BaseHTTPRequestHandler):
+    # configured by make_server()
+    listings = []
+    per_page = 12
+    latency = 0.0
+    jitter = 0.0
+    submissions = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def delay(self):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+    def send(self, body, content_type="text/html; charset=utf-8", status=200):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.delay()
+        if url.path == "/huur/woningen":
+            checkboxes = "".join(CHECKBOX.format(label=t) for t in HOME_TYPES)
+            self.send(LIST_PAGE.replace("__CHECKBOXES__", checkboxes))
+        elif url.path == "/api/offers":
+            self.send(json.dumps(self.offers(parse_qs(url.query))), "application/json")
+        elif url.path.startswith("/huur/woningen/"):
+            self.detail(url.path.rsplit("/", 1)[-1])
+        elif url.path == "/thank-you/":
+            self.send("<!DOCTYPE html><html><body><h1>Bedankt voor je interesse!</h1></body></html>")
+        else:
+            self.send("Not found", "text/plain", 404)
+
+    def do_POST(self):
+        self.delay()
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if urlparse(self.path).path == "/api/subscribe":
+            type(self).submissions += 1
+            self.send("{}", "application/json")
+        else:
+            self.send("Not found", "text/plain", 404)
+
+    def offers(self, query):
+        types = [t for t in (query.get("types", [""])[0]).split(",") if t]
+        page = int(query.get("page", ["1"])[0])
+        matches = [l for l in self.listings if not types or l["type"] in types]
+        pages = max(1, math.ceil(len(matches) / self.per_page))
+        items = matches[(page - 1) * self.per_page:page * self.per_page]
+        return {
+            "page": page,
+            "pages": pages,
+            "items": [dict(l, price_text=format_price(l["price"])) for l in items],
+        }
+
+    def detail(self, listing_id):
+        listing = next((l for l in self.listings if str(l["id"]) == listing_id), None)
+        if listing is None:
+            self.send("Not found", "text/plain", 404)
+            return
+        page = (DETAIL_PAGE
+                .replace("__TITLE__", f"{listing['street']}, {listing['city']}")
+                .replace("__PRICE__", format_price(listing["price"]))
+                .replace("__AREA__", str(listing["area"]))
+                .replace("__BEDROOMS__", str(listing["bedrooms"]))
+                .replace("__TOGGLES__", "".join(TOGGLE.format(id=t) for t in TOGGLE_IDS))
+                .replace("__ID__", str(listing["id"])))
+        self.send(page)
+
+def make_server(port=0, pages=3, per_page=12, latency=0.0, jitter=0.0, seed=1):
+    """Create (but do not start) a stand-in server; port 0 picks a free port."""
+    handler = type("Handler", (StandinHandler,), {
+        "listings": generate_listings(pages, per_page, seed),
+        "per_page": per_page,
+        "latency": latency,
+        "jitter": jitter,
+        "submissions": 0,
+    })
+    return ThreadingHTTPServer(("127.0.0.1", port), handler)
+
+def start_in_thread(**kwargs):
+    """Start a stand-in server on a daemon thread and return it."""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/huur/woningen?filter=stage:available"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--pages", type=int, default=3, help="result pages per home type")
+    parser.add_argument("--per-page", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    server = make_server(args.port, args.pages, args.per_page, args.latency, args.jitter, args.seed)
+    print(f"Stand-in site on {base_url(server)}")
+    server.serve_forever()